@@ -126,6 +126,43 @@ v0.3.6 - 19 April 2010
 		inspection keeps the code backward compatible
 	Moved testing code into separate testbench (testbench.py)
 
+v0.3.7
+	OSCMessage keeps its arguments as a list of Python values; binary is generated on demand
+	Fixed decoding of the fractional part of OSC-timetags
+	OSCMessage encodes into a growable buffer; appending & same-size replacements no longer re-encode the message
+	Added OSCMessageTemplate, for packing messages with a fixed address & typetag-signature
+	OSCClient.send() & sendto() also accept already encoded OSC-packets
+	decodeOSC() decodes in a single pass, reading fields by offset; accepts str, bytearray & memoryview
+	Stream handlers receive into preallocated bytearrays (recv_into)
+	Added 'blob_views' decoding mode (blobs as memoryviews into the received packet) & copyBlob()
+	OSCMessage.append() converts numpy-arrays & array.arrays of ints/floats in one go
+	Added 'array_runs' decoding mode (runs of equal i/f/d arguments as one numpy-array or array.array)
+	Added LRUCache & the module-level 'signatureCache' of precompiled structs per typetag-signature, used by getBinary() & decodeOSC()
+	OSCBundle keeps its OSCMessage objects and encodes them lazily into one preallocated buffer
+	Fixed OSCMultiClient.send() prefixing the unfiltered message for targets with both a prefix & filters
+	OSCMessage & OSCBundle keep their binary representation until they are changed
+	OSCAddressSpace indexes its addresses in a tree of address-parts; wildcards match within one address-part (as per the OSC-spec)
+	Plain OSC-addresses dispatch with a single dict-lookup; compiled address-patterns are kept in the module-level 'patternCache'
+	OSCAddressSpace remembers the addresses matched by recent wildcard-patterns in its 'matchCache'
+	Added OSCPattern & getPattern(): OSC address-patterns compiled per address-part, without regular expressions; '[!...]' negates. Used by OSCServer dispatch & OSCMultiClient filters
+	Added OSCServer.lazy_decoding: only the addresses of incoming messages are decoded until a callback matches; unhandled messages are counted in OSCServer.stats
+	Added addTypedMsgHandler(): handlers for a fixed typetag-signature, called with the message's arguments as positional arguments
+	Fixed dispatchMessage() rejecting messages decoded with 'array_runs'; their arrays are passed to the callbacks as they are
+	addMsgHandler() accepts OSC address-patterns; messages to addresses without a callback of their own are handled by the callbacks of the patterns they match
+	OSCServer.handle_request() reads all waiting datagrams (up to 'max_burst') before handling them
+	Added OSCServer.addStateAddress(): of the messages to a 'state'-address received in one burst, only the newest is dispatched
+	Added addBatchMsgHandler(): handlers called once with all messages for their address received in one burst (or packet)
+	OSCAddressSpace keeps its state in an immutable snapshot, swapped on every change; dispatching is safe while handlers are added or removed, and only takes a lock to store a cache-miss
+	OSCServer.drain_socket: read all waiting datagrams into reused buffers, decode them in place (checking verify_request()) & handle them with one reused request-handler (optionally through Linux' recvmmsg(), see use_recvmmsg)
+	Added OSCScheduler: bundles with a future timetag are queued for a single timer-thread instead of blocking the receiving thread, with late-arrival policies & jitter-statistics
+	Added PooledOSCServer & OSCWorkerPool: requests and bundle-elements are handled by a fixed pool of worker-threads with a bounded queue, overflow-policies & queue-depth stats
+	Added PreforkedOSCServer: worker-processes sharing one UDP-port through SO_REUSEPORT, supervised & restarted, with their stats added up through shared memory
+	Fixed OSCServer replies (sent through OSCClient.sendto()) connecting the server's socket, after which it only received from that one client
+	Added asynchronous (asyncore) OSC endpoints: OSCAsyncServer, OSCAsyncClient, OSCAsyncStreamServer & OSCAsyncStreamClient, served by asyncLoop()
+	Added addMsgHandlers() & delMsgHandlers(), to change many handlers with a single copy of the address-space snapshot
+	PooledOSCServer counts the requests its worker-pool discards in stats['dropped_requests']; the pool's 'blocked' stat counts each blocked submit() once
+	decodeOSC(memoryview, blob_views=True) returns blob-views into that memoryview, rather than into the copy it decodes the other arguments from
+
 -----------------
 Original Comments
 -----------------
@@ -158,7 +195,7 @@ Original Comments
 > 	- dwh
 """
 
-import math, re, socket, select, string, struct, sys, threading, time, types, array, errno, inspect
+import math, os, re, signal, socket, select, string, struct, sys, threading, time, types, array, errno, inspect, itertools, heapq, collections, mmap, asyncore, asynchat
 from SocketServer import UDPServer, DatagramRequestHandler, ForkingMixIn, ThreadingMixIn, StreamRequestHandler, TCPServer
 from contextlib import closing
 
@@ -171,6 +208,9 @@ FloatTypes = [types.FloatType]
 global IntTypes
 IntTypes = [types.IntType]
 
+# the types OSCMessage.append() can normalize right away, without checking for arrays & sequences
+_scalarTypes = frozenset([types.IntType, types.LongType, types.FloatType, types.StringType, types.UnicodeType, types.BooleanType])
+
 global NTP_epoch
 from calendar import timegm
 NTP_epoch = timegm((1900,1,1,0,0,0)) # NTP time started in 1 Jan 1900
@@ -179,11 +219,19 @@ del timegm
 global NTP_units_per_second
 NTP_units_per_second = 0x100000000 # about 232 picoseconds
 
+# precompiled structs for the fixed-width OSC types
+_int32 = struct.Struct(">i")
+_float32 = struct.Struct(">f")
+_float64 = struct.Struct(">d")
+
+_fixedWidthStructs = {'i':_int32, 'f':_float32, 'd':_float64}
+
 ##
 # numpy/scipy support:
 ##
 
 try:
+	import numpy as _numpy
 	from numpy import typeDict
 
 	for ftype in ['float32', 'float64', 'float128']:
@@ -203,7 +251,23 @@ try:
 	del typeDict, ftype, itype
 	
 except ImportError:
-	pass
+	_numpy = None
+
+##
+# ctypes support (for reading many datagrams in one system-call, see OSCServer.use_recvmmsg):
+##
+
+try:
+	import ctypes as _ctypes
+	import ctypes.util
+except ImportError:
+	_ctypes = None
+
+# the socket-option that lets several sockets bind the same UDP-port (see PreforkedOSCServer).
+# Python 2's socket-module doesn't always define it; its value on Linux is 15.
+_SO_REUSEPORT = getattr(socket, 'SO_REUSEPORT', None)
+if (_SO_REUSEPORT == None) and sys.platform.startswith('linux'):
+	_SO_REUSEPORT = 15
 
 ######
 #
@@ -240,6 +304,14 @@ class OSCMessage(object):
 	To construct an 'OSC-bundle' from multiple OSCMessage, see OSCBundle!
 	
 	Additional methods exist for retreiving typetags or manipulating items as (typetag, value) tuples.
+
+	Internally, the message keeps its arguments as a list of Python values (exactly as they will be
+	read back by the receiver) and a list of typetags. The binary representation is only generated
+	when getBinary() is called, so reading arguments back costs no more than reading a list.
+	Once generated, the encoded arguments are kept in a growable buffer; appending to the message
+	extends that buffer, and replacing an argument by one of the same encoded size (e.g. an 'i', 'f'
+	or 'd' argument by another one of the same type) patches the buffer in place.
+	The complete binary message is kept as well, until the message's address or arguments change.
 	"""
 	def __init__(self, address="", *args):
 		"""Instantiate a new OSCMessage.
@@ -255,6 +327,15 @@ class OSCMessage(object):
 		"""
 		self.address = address
 
+	def _getAddress(self):
+		return self._address
+
+	def _setAddress(self, address):
+		self._address = address
+		self._binary = None
+
+	address = property(_getAddress, _setAddress, doc="The OSC-address of the message")
+
 	def clear(self, address=""):
 		"""Clear (or set a new) OSC-address and clear any arguments appended so far
 		"""
@@ -264,52 +345,189 @@ class OSCMessage(object):
 	def clearData(self):
 		"""Clear any arguments appended so far
 		"""
-		self.typetags = ","
-		self.message  = ""
+		self._args = []
+		self._tags = []
+		self._buffer = None
+		self._offsets = None
+		self._payload = None
+		self._binary = None
+
+	def _normalize(self, argument, typehint=None):
+		"""Convert a single argument to a (typetag, value) tuple
+		"""
+		return _normalizeArgument(argument, typehint)
+
+	def _encodeItem(self, tag, value):
+		"""Returns the binary representation of a normalized (typetag, value) pair
+		"""
+		return _encodeArgument(tag, value)
+
+	def _invalidate(self):
+		"""Discard the encoded arguments. They will be re-encoded when needed
+		"""
+		self._buffer = None
+		self._offsets = None
+		self._payload = None
+		self._binary = None
+
+	def _appendItem(self, tag, value):
+		"""Append a normalized (typetag, value) pair, extending the encoded
+		arguments-buffer if there is one.
+		"""
+		self._tags.append(tag)
+		self._args.append(value)
+		self._binary = None
+
+		if self._buffer != None:
+			self._offsets.append(len(self._buffer))
+			self._buffer += self._encodeItem(tag, value)
+			self._payload = None
+
+	def _appendRun(self, tag, values, binary):
+		"""Append a run of normalized values which all have the same (fixed-width) typetag,
+		and their binary representation
+		"""
+		if self._buffer == None:
+			self._encodeArguments()
+		
+		offset = len(self._buffer)
+		self._tags.extend(tag * len(values))
+		self._args.extend(values)
+		self._offsets.extend(xrange(offset, offset + len(binary), _fixedWidthStructs[tag].size))
+		self._buffer += binary
+		self._payload = None
+		self._binary = None
+	
+	def _patchItem(self, i, tag, value):
+		"""Replace the argument at index 'i' by a normalized (typetag, value) pair.
+		If the new argument encodes to the same number of bytes as the old one,
+		the encoded arguments-buffer is patched in place.
+		"""
+		old_tag = self._tags[i]
+		self._tags[i] = tag
+		self._args[i] = value
+		self._binary = None
+
+		if self._buffer == None:
+			return
+
+		if i < 0:
+			i += len(self._args)
+
+		start = self._offsets[i]
+		if (tag == old_tag) and (tag in _fixedWidthStructs):
+			_fixedWidthStructs[tag].pack_into(self._buffer, start, value)
+			self._payload = None
+			return
+
+		if i + 1 < len(self._offsets):
+			end = self._offsets[i + 1]
+		else:
+			end = len(self._buffer)
+
+		binary = self._encodeItem(tag, value)
+		if len(binary) == (end - start):
+			self._buffer[start:end] = binary
+			self._payload = None
+		else:
+			self._invalidate()
+
+	def _truncate(self, i):
+		"""Remove all arguments from index 'i' onwards, truncating the encoded
+		arguments-buffer if there is one.
+		"""
+		if self._buffer != None:
+			if i < len(self._offsets):
+				del self._buffer[self._offsets[i]:]
+				del self._offsets[i:]
+			self._payload = None
+
+		del self._tags[i:]
+		del self._args[i:]
+		self._binary = None
 
 	def append(self, argument, typehint=None):
 		"""Appends data to the message, updating the typetags based on
 		the argument's type. If the argument is a blob (counted
 		string) pass in 'b' as typehint.
 		'argument' may also be a list or tuple, in which case its elements
-		will get appended one-by-one, all using the provided typehint
+		will get appended one-by-one, all using the provided typehint.
+		numpy-arrays and array.arrays of ints or floats are converted & appended in one go.
 		"""
-		if type(argument) == types.DictType:
-			argument = argument.items()
-		elif isinstance(argument, OSCMessage):
-			raise TypeError("Can only append 'OSCMessage' to 'OSCBundle'")
-		
-		if hasattr(argument, '__iter__'):
-			for arg in argument:
-				self.append(arg, typehint)
+		if type(argument) not in _scalarTypes:
+			if type(argument) == types.DictType:
+				argument = argument.items()
+			elif isinstance(argument, OSCMessage):
+				raise TypeError("Can only append 'OSCMessage' to 'OSCBundle'")
 			
-			return
+			packed = _packArray(argument, typehint)
+			if packed != None:
+				self._appendRun(*packed)
+				return
+			
+			if hasattr(argument, '__iter__'):
+				for arg in argument:
+					self.append(arg, typehint)
+				
+				return
 		
-		if typehint == 'b':
-			binary = OSCBlob(argument)
-			tag = 'b'
-		elif typehint == 't':
-			binary = OSCTimeTag(argument)
-			tag = 't'
-		else:
-			tag, binary = OSCArgument(argument, typehint)
+		(tag, value) = self._normalize(argument, typehint)
+
+		self._appendItem(tag, value)
+
+	def _encodeArguments(self):
+		"""(Re)build the encoded arguments-buffer.
+		Runs of fixed-width arguments are packed with the precompiled structs of the message's signature
+		"""
+		buf = bytearray()
+		offsets = []
+		(_, runs) = _getSignature("".join(self._tags))
+		for (start, end, packer, run_offsets) in runs:
+			base = len(buf)
+			if packer != None:
+				buf += packer.pack(*self._args[start:end])
+				offsets.extend([base + offset for offset in run_offsets])
+			else:
+				offsets.append(base)
+				buf += self._encodeItem(self._tags[start], self._args[start])
 
-		self.typetags += tag
-		self.message += binary
+		self._buffer = buf
+		self._offsets = offsets
+
+	def _encodePayload(self):
+		"""Returns the binary representation of the arguments appended so far
+		"""
+		if self._payload == None:
+			if self._buffer == None:
+				self._encodeArguments()
+
+			self._payload = str(self._buffer)
+
+		return self._payload
 		
 	def getBinary(self):
-		"""Returns the binary representation of the message
+		"""Returns the binary representation of the message.
+		This is kept until the message is changed, so re-sending an unchanged message doesn't re-encode it
 		"""
-		binary = OSCString(self.address)
-		binary += OSCString(self.typetags)
-		binary += self.message
+		if self._binary == None:
+			binary = OSCString(self.address)
+			binary += _getSignature("".join(self._tags))[0]
+			binary += self._encodePayload()
+			self._binary = binary
 		
-		return binary
+		return self._binary
+
+	def _getTypetags(self):
+		return "," + "".join(self._tags)
+
+	typetags = property(_getTypetags, doc="The OSC-typetag string of the message, including the leading ','")
+
+	message = property(_encodePayload, doc="The binary representation of the message's arguments")
 
 	def __repr__(self):
 		"""Returns a string containing the decode Message
 		"""
-		return str(decodeOSC(self.getBinary()))
+		return str([self.address, self.typetags] + self._args)
 
 	def __str__(self):
 		"""Returns the Message's address and contents as a string.
@@ -319,7 +537,7 @@ class OSCMessage(object):
 	def __len__(self):
 		"""Returns the number of arguments appended so far
 		"""
-		return (len(self.typetags) - 1)
+		return len(self._args)
 	
 	def __eq__(self, other):
 		"""Return True if two OSCMessages have the same address & content
@@ -327,7 +545,7 @@ class OSCMessage(object):
 		if not isinstance(other, self.__class__):
 			return False
 		
-		return (self.address == other.address) and (self.typetags == other.typetags) and (self.message == other.message)
+		return (self.address == other.address) and (self._tags == other._tags) and (self.message == other.message)
 	
 	def __ne__(self, other):
 		"""Return (not self.__eq__(other))
@@ -362,52 +580,58 @@ class OSCMessage(object):
 		
 		return out
 	
-	def _reencode(self, items):
-		"""Erase & rebuild the OSCMessage contents from the given
-		list of (typehint, value) tuples"""
-		self.clearData()
-		for item in items:
-			self.append(item[1], item[0])
+	def _normalizeItems(self, items):
+		"""Convert a list of (typehint, value) tuples, as returned by _buildItemList(),
+		to two lists of typetags & values.
+		"""
+		tags = []
+		args = []
+		for (typehint, value) in items:
+			(tag, value) = self._normalize(value, typehint)
+			tags.append(tag)
+			args.append(value)
+
+		return (tags, args)
 		
 	def values(self):
 		"""Returns a list of the arguments appended so far
 		"""
-		return decodeOSC(self.getBinary())[2:]
+		return list(self._args)
 	
 	def tags(self):
 		"""Returns a list of typetags of the appended arguments
 		"""
-		return list(self.typetags.lstrip(','))
+		return list(self._tags)
 	
 	def items(self):
 		"""Returns a list of (typetag, value) tuples for 
 		the arguments appended so far
 		"""
-		out = []
-		values = self.values()
-		typetags = self.tags()
-		for i in range(len(values)):
-			out.append((typetags[i], values[i]))
-			
-		return out
+		return zip(self._tags, self._args)
 
 	def __contains__(self, val):
 		"""Test if the given value appears in the OSCMessage's arguments
 		"""
-		return (val in self.values())
+		return (val in self._args)
 
 	def __getitem__(self, i):
 		"""Returns the indicated argument (or slice)
 		"""
-		return self.values()[i]
+		return self._args[i]
 
 	def __delitem__(self, i):
 		"""Removes the indicated argument (or slice)
 		"""
-		items = self.items()
-		del items[i]
+		if type(i) != types.SliceType:
+			n = len(self._args)
+			if n and ((i == -1) or (i == n - 1)):
+				self._truncate(n - 1)
+				return
+
+		del self._args[i]
+		del self._tags[i]
 			
-		self._reencode(items)
+		self._invalidate()
 	
 	def _buildItemList(self, values, typehint=None):
 		if isinstance(values, OSCMessage):
@@ -431,77 +655,83 @@ class OSCMessage(object):
 		'val' can be a single int/float/string, or a (typehint, value) tuple.
 		Or, if 'i' is a slice, a list of these or another OSCMessage.
 		"""
-		items = self.items()
-		
-		new_items = self._buildItemList(val)
+		(tags, args) = self._normalizeItems(self._buildItemList(val))
 		
 		if type(i) != types.SliceType:
-			if len(new_items) != 1:
+			if len(args) != 1:
 				raise TypeError("single-item assignment expects a single value or a (typetag, value) tuple")
 			
-			new_items = new_items[0]
+			self._patchItem(i, tags[0], args[0])
+			return
 			
 		# finally...
-		items[i] = new_items
+		self._tags[i] = tags
+		self._args[i] = args
 		
-		self._reencode(items)
+		self._invalidate()
 	
 	def setItem(self, i, val, typehint=None):
 		"""Set indicated argument to a new value (with typehint)
 		"""
-		items = self.items()
+		(tag, value) = self._normalize(val, typehint)
 		
-		items[i] = (typehint, val)
-			
-		self._reencode(items)
+		self._patchItem(i, tag, value)
 		
 	def copy(self):
 		"""Returns a deep copy of this OSCMessage
 		"""
 		msg = self.__class__(self.address)
-		msg.typetags = self.typetags
-		msg.message = self.message
+		msg._tags = list(self._tags)
+		msg._args = list(self._args)
+		if self._buffer != None:
+			msg._buffer = bytearray(self._buffer)
+			msg._offsets = list(self._offsets)
+		msg._payload = self._payload
+		msg._binary = self._binary
 		return msg
 	
 	def count(self, val):
 		"""Returns the number of times the given value occurs in the OSCMessage's arguments
 		"""
-		return self.values().count(val)
+		return self._args.count(val)
 	
 	def index(self, val):
 		"""Returns the index of the first occurence of the given value in the OSCMessage's arguments.
 		Raises ValueError if val isn't found
 		"""
-		return self.values().index(val)
+		return self._args.index(val)
 	
 	def extend(self, values):
 		"""Append the contents of 'values' to this OSCMessage.
 		'values' can be another OSCMessage, or a list/tuple of ints/floats/strings
 		"""
-		items = self.items() + self._buildItemList(values)
-		
-		self._reencode(items)
+		for (typehint, value) in self._buildItemList(values):
+			(tag, value) = self._normalize(value, typehint)
+			self._appendItem(tag, value)
 		
 	def insert(self, i, val, typehint = None):
 		"""Insert given value (with optional typehint) into the OSCMessage
 		at the given index.
 		"""
-		items = self.items()
+		(tags, args) = self._normalizeItems(self._buildItemList(val, typehint))
 		
-		for item in reversed(self._buildItemList(val)):
-			items.insert(i, item)
+		if i >= len(self._args):
+			for (tag, value) in zip(tags, args):
+				self._appendItem(tag, value)
+			return
+
+		self._tags[i:i] = tags
+		self._args[i:i] = args
 			
-		self._reencode(items)
+		self._invalidate()
 		
 	def popitem(self, i):
 		"""Delete the indicated argument from the OSCMessage, and return it
 		as a (typetag, value) tuple.
 		"""
-		items = self.items()
+		item = (self._tags[i], self._args[i])
 		
-		item = items.pop(i)
-		
-		self._reencode(items)
+		del self[i]
 		
 		return item
 	
@@ -513,47 +743,36 @@ class OSCMessage(object):
 	def reverse(self):
 		"""Reverses the arguments of the OSCMessage (in place)
 		"""
-		items = self.items()
-		
-		items.reverse()
+		self._tags.reverse()
+		self._args.reverse()
 		
-		self._reencode(items)
+		self._invalidate()
 		
 	def remove(self, val):
 		"""Removes the first argument with the given value from the OSCMessage.
 		Raises ValueError if val isn't found.
 		"""
-		items = self.items()
-		
-		# this is not very efficient...
-		i = 0
-		for (t, v) in items:
-			if (v == val):
-				break
-			i += 1
-		else:
-			raise ValueError("'%s' not in OSCMessage" % str(m))
-		# but more efficient than first calling self.values().index(val),
-		# then calling self.items(), which would in turn call self.values() again...
-		
-		del items[i]
+		try:
+			i = self._args.index(val)
+		except ValueError:
+			raise ValueError("'%s' not in OSCMessage" % str(val))
 		
-		self._reencode(items)
+		del self[i]
 		
 	def __iter__(self):
 		"""Returns an iterator of the OSCMessage's arguments
 		"""
-		return iter(self.values())
+		return iter(self._args)
 
 	def __reversed__(self):
 		"""Returns a reverse iterator of the OSCMessage's arguments
 		"""
-		return reversed(self.values())
+		return reversed(self._args)
 
 	def itervalues(self):
 		"""Returns an iterator of the OSCMessage's arguments
 		"""
-		return iter(self.values())
+		return iter(self._args)
 
 	def iteritems(self):
 		"""Returns an iterator of the OSCMessage's arguments as
@@ -564,7 +783,7 @@ class OSCMessage(object):
 	def itertags(self):
 		"""Returns an iterator of the OSCMessage's arguments' typetags
 		"""
-		return iter(self.tags())
+		return iter(self._tags)
 
 class OSCBundle(OSCMessage):
 	"""Builds a 'bundle' of OSC messages.
@@ -580,6 +799,8 @@ class OSCBundle(OSCMessage):
 	  The OSCBundle's 'address' is inherited by any OSCMessage the OSCBundle object creates.
 	  - OSC-bundles have a timetag to tell the receiver when the bundle should be processed.
 	  The default timetag value (0) means 'immediately'
+	  - the bundle keeps (copies of) the appended OSCMessage objects, and only encodes them when
+	  its binary representation is needed. Reading them back returns copies as well.
 	"""
 	def __init__(self, address="", time=0):
 		"""Instantiate a new OSCBundle.
@@ -599,7 +820,7 @@ class OSCBundle(OSCMessage):
 			out = "#bundle ["
 
 		if self.__len__():
-			for val in self.values():
+			for val in self._args:
 				out += "%s, " % str(val)
 			out = out[:-2]		# strip trailing space and comma
 			
@@ -611,6 +832,15 @@ class OSCBundle(OSCMessage):
 		"""
 		if time >= 0:
 			self.timetag = time
+
+	def _getTimeTag(self):
+		return self._timetag
+
+	def _setTimeTag(self, time):
+		self._timetag = time
+		self._binary = None
+
+	timetag = property(_getTimeTag, _setTimeTag, doc="The OSCBundle's TimeTag, in floating seconds since the Epoch")
 	
 	def getTimeTagStr(self):
 		"""Return the TimeTag as a human-readable string
@@ -621,6 +851,50 @@ class OSCBundle(OSCMessage):
 		
 		return out
 	
+	def _normalize(self, argument, typehint=None):
+		"""Encapsulate the given argument in an OSCMessage (unless it already is one)
+		and return a ('b', <OSCMessage>) tuple.
+		OSCMessages (and OSCBundles) are copied, so changing them afterwards doesn't change the bundle.
+		"""
+		if isinstance(argument, OSCMessage):
+			return ('b', argument.copy())
+
+		msg = OSCMessage(self.address)
+		if type(argument) == types.DictType:
+			if 'addr' in argument:
+				msg.setAddress(argument['addr'])
+			if 'args' in argument:
+				msg.append(argument['args'], typehint)
+		else:
+			msg.append(argument, typehint)
+
+		return ('b', msg)
+
+	def _encodeItem(self, tag, value):
+		"""Returns the binary representation of a contained OSCMessage, prepended by its size
+		"""
+		binary = value.getBinary()
+		return _int32.pack(len(binary)) + binary
+
+	def _encodeArguments(self):
+		"""(Re)build the encoded arguments-buffer.
+		The contained OSCMessages are encoded first, so the buffer can be allocated at its final size
+		and filled in a single pass.
+		"""
+		binaries = [msg.getBinary() for msg in self._args]
+		buf = bytearray(sum(map(len, binaries)) + (4 * len(binaries)))
+		offsets = []
+		offset = 0
+		for binary in binaries:
+			offsets.append(offset)
+			_int32.pack_into(buf, offset, len(binary))
+			offset += 4
+			buf[offset:offset + len(binary)] = binary
+			offset += len(binary)
+
+		self._buffer = buf
+		self._offsets = offsets
+
 	def append(self, argument, typehint = None):
 		"""Appends data to the bundle, creating an OSCMessage to encapsulate
 		the provided argument unless this is already an OSCMessage.
@@ -630,71 +904,341 @@ class OSCBundle(OSCMessage):
 		  - if 'addr' appears in the dict, its value overrides the OSCBundle's address
 		  - if 'args' appears in the dict, its value(s) become the OSCMessage's arguments
 		"""
-		if isinstance(argument, OSCMessage):
-			binary = OSCBlob(argument.getBinary())
-		else:
-			msg = OSCMessage(self.address)
-			if type(argument) == types.DictType:
-				if 'addr' in argument:
-					msg.setAddress(argument['addr'])
-				if 'args' in argument:
-					msg.append(argument['args'], typehint)
-			else:
-				msg.append(argument, typehint)
-			
-			binary = OSCBlob(msg.getBinary())
+		(tag, value) = self._normalize(argument, typehint)
+
+		self._appendItem(tag, value)
 
-		self.message += binary
-		self.typetags += 'b'
-		
 	def getBinary(self):
-		"""Returns the binary representation of the message
+		"""Returns the binary representation of the bundle.
+		This is kept until the bundle is changed, so re-sending an unchanged bundle doesn't re-encode it
 		"""
-		binary = OSCString("#bundle")
-		binary += OSCTimeTag(self.timetag)
-		binary += self.message
-		
-		return binary
+		if self._binary == None:
+			binary = OSCString("#bundle")
+			binary += OSCTimeTag(self.timetag)
+			binary += self._encodePayload()
+			self._binary = binary
+
+		return self._binary
+
+	def __repr__(self):
+		"""Returns a string containing the decoded Bundle
+		"""
+		return str(decodeOSC(self.getBinary()))
 
-	def _reencapsulate(self, decoded):
-		if decoded[0] == "#bundle":
-			msg = OSCBundle()
-			msg.setTimeTag(decoded[1])
-			for submsg in decoded[2:]:
-				msg.append(self._reencapsulate(submsg))
-				
-		else:
-			msg = OSCMessage(decoded[0])
-			tags = decoded[1].lstrip(',')
-			for i in range(len(tags)):
-				msg.append(decoded[2+i], tags[i])
-				
-		return msg
-	
 	def values(self):
-		"""Returns a list of the OSCMessages appended so far
+		"""Returns a list of (copies of) the OSCMessages appended so far
 		"""
-		out = []
-		for decoded in decodeOSC(self.getBinary())[2:]:
-			out.append(self._reencapsulate(decoded))
-			
-		return out
-		
+		return [msg.copy() for msg in self._args]
+
+	def __getitem__(self, i):
+		"""Returns (a copy of) the indicated OSCMessage (or slice)
+		"""
+		if type(i) == types.SliceType:
+			return [msg.copy() for msg in self._args[i]]
+
+		return self._args[i].copy()
+
+	def __contains__(self, val):
+		"""Test if the given OSCMessage appears in the OSCBundle
+		"""
+		return (val in self._args)
+
+	def count(self, val):
+		"""Returns the number of times the given OSCMessage occurs in the OSCBundle
+		"""
+		return self._args.count(val)
+
+	def index(self, val):
+		"""Returns the index of the first occurence of the given OSCMessage in the OSCBundle.
+		Raises ValueError if val isn't found
+		"""
+		return self._args.index(val)
+
+	def remove(self, val):
+		"""Removes the first occurence of the given OSCMessage from the OSCBundle.
+		Raises ValueError if val isn't found.
+		"""
+		try:
+			i = self.index(val)
+		except ValueError:
+			raise ValueError("'%s' not in OSCBundle" % str(val))
+
+		del self[i]
+
+	def items(self):
+		"""Returns a list of ('b', OSCMessage) tuples for
+		the OSCMessages appended so far
+		"""
+		return [('b', msg) for msg in self.values()]
+
+	def __iter__(self):
+		"""Returns an iterator of (copies of) the OSCBundle's OSCMessages
+		"""
+		return (msg.copy() for msg in self._args)
+
+	def __reversed__(self):
+		"""Returns a reverse iterator of (copies of) the OSCBundle's OSCMessages
+		"""
+		return (msg.copy() for msg in reversed(self._args))
+
+	def itervalues(self):
+		"""Returns an iterator of (copies of) the OSCBundle's OSCMessages
+		"""
+		return self.__iter__()
+
+	def popitem(self, i):
+		"""Delete the indicated OSCMessage from the OSCBundle, and return it
+		as a ('b', OSCMessage) tuple.
+		"""
+		item = ('b', self._args[i])
+		del self[i]
+
+		return item
+
 	def __eq__(self, other):
 		"""Return True if two OSCBundles have the same timetag & content
 		"""
 		if not isinstance(other, self.__class__):
 			return False
-		
-		return (self.timetag == other.timetag) and (self.typetags == other.typetags) and (self.message == other.message)
+
+		return (self.timetag == other.timetag) and (self._args == other._args)
 	
 	def copy(self):
-		"""Returns a deep copy of this OSCBundle
+		"""Returns a deep copy of this OSCBundle.
+		(The contained OSCMessages are never changed in place, so the copy can share them)
 		"""
 		copy = super(OSCBundle, self).copy()
 		copy.timetag = self.timetag
+		copy._binary = self._binary
 		return copy
 
+class OSCMessageTemplate(object):
+	"""Packs OSC-messages with a fixed OSC-address and typetag-signature.
+
+	For traffic that always uses the same address and the same argument types,
+	an OSCMessageTemplate does all the work that doesn't depend on the argument values
+	(padding the address & typetag strings, building the struct-format) only once:
+	  >>> tmpl = OSCMessageTemplate("/user/1", ",fff")
+	  >>> client.send(tmpl.pack(1.0, 2.0, 3.0))
+
+	pack() returns the binary OSC-message as a string, which can be passed directly
+	to OSCClient.send() or OSCClient.sendto().
+	The fixed-width ('i', 'f', 'd') arguments are packed with a single struct.Struct;
+	if the signature contains only fixed-width types, the whole message is produced by
+	one call to that struct. Variable-width arguments ('s', 'b', 't') are encoded as
+	OSCMessage.append() would with the corresponding typehint.
+	"""
+	def __init__(self, address, typetags):
+		"""Instantiate a new OSCMessageTemplate.
+		  - address (string): the OSC-address of the messages
+		  - typetags (string): the OSC-typetags of the messages' arguments.
+		  The leading ',' is optional.
+		"""
+		tags = typetags.lstrip(',')
+		for tag in tags:
+			if tag not in 'ifdsbt':
+				raise OSCError("Unsupported OSC-typetag '%s' in template signature '%s'" % (tag, typetags))
+
+		self.address = address
+		self.typetags = "," + tags
+
+		prefix = OSCString(address) + OSCString(self.typetags)
+		fixed = "".join([tag for tag in tags if tag in _fixedWidthStructs])
+
+		if len(fixed) == len(tags):
+			self._struct = struct.Struct(">%ds%s" % (len(prefix), fixed))
+			self._segments = None
+		else:
+			# one struct for all fixed-width args, whose encoded values are spliced
+			# between the variable-width ones
+			self._struct = struct.Struct(">" + fixed)
+			self._fixed_index = [i for (i, tag) in enumerate(tags) if tag in _fixedWidthStructs]
+			self._segments = []
+			offset = 0
+			for (i, tag) in enumerate(tags):
+				if tag in _fixedWidthStructs:
+					size = _fixedWidthStructs[tag].size
+					self._segments.append((None, offset, offset + size))
+					offset += size
+				else:
+					self._segments.append((tag, i, None))
+
+		self._prefix = prefix
+		self._nargs = len(tags)
+
+	def pack(self, *values):
+		"""Returns the binary OSC-message with the given argument values
+		"""
+		if len(values) != self._nargs:
+			raise TypeError("OSCMessageTemplate '%s %s' takes %d arguments (%d given)" % (self.address, self.typetags, self._nargs, len(values)))
+
+		if self._segments == None:
+			return self._struct.pack(self._prefix, *values)
+
+		fixed = self._struct.pack(*[values[i] for i in self._fixed_index])
+
+		binary = [self._prefix]
+		for (tag, start, end) in self._segments:
+			if tag == None:
+				binary.append(fixed[start:end])
+			else:
+				binary.append(_encodeArgument(*_normalizeArgument(values[start], tag)))
+
+		return "".join(binary)
+
+	def __str__(self):
+		"""Returns the template's address and typetags as a string.
+		"""
+		return "%s %s" % (self.address, self.typetags)
+
+######
+#
+# Typetag-signature cache
+#
+######
+
+class LRUCache(object):
+	"""A thread-safe dictionary holding at most 'maxsize' items.
+	When full, an item that hasn't been used recently is discarded to make room for a new one.
+	Lookups with get() are counted as cache-hits or -misses.
+	Lookups don't take a lock; they are a dict-lookup that sets the item's 'used' flag.
+	Storing new items takes the lock, and evicts like a 'clock': the items are kept in a ring,
+	in order of insertion, and the first one found without its flag set is discarded,
+	clearing the flags of those passed over (which get a second chance).
+	"""
+	def __init__(self, maxsize=128):
+		self.maxsize = maxsize
+		
+		# [value, used] lists per key, and the ring of keys
+		self._items = {}
+		self._ring = collections.deque()
+		self._lock = threading.Lock()
+		self.hits = 0
+		self.misses = 0
+
+	def get(self, key, default=None):
+		"""Returns the item stored under 'key' and marks it as recently used,
+		or returns 'default' if there is no such item
+		"""
+		try:
+			entry = self._items[key]
+		except KeyError:
+			self.misses += 1
+			return default
+
+		entry[1] = True
+		self.hits += 1
+		return entry[0]
+
+	def __setitem__(self, key, value):
+		"""Stores 'value' under 'key', discarding an item that hasn't been used recently if the cache is full
+		"""
+		self._lock.acquire()
+		try:
+			if key not in self._items:
+				ring = self._ring
+				while len(ring) >= self.maxsize:
+					oldest = ring.popleft()
+					entry = self._items[oldest]
+					if entry[1]:
+						entry[1] = False
+						ring.append(oldest)
+					else:
+						del self._items[oldest]
+
+				ring.append(key)
+
+			self._items[key] = [value, False]
+		finally:
+			self._lock.release()
+
+	def __contains__(self, key):
+		"""Test if an item is stored under 'key' (without counting a hit or miss)
+		"""
+		return key in self._items
+
+	def __len__(self):
+		"""Returns the number of items in the cache
+		"""
+		return len(self._items)
+
+	def clear(self):
+		"""Discards all items
+		"""
+		self._lock.acquire()
+		try:
+			self._items.clear()
+			self._ring.clear()
+		finally:
+			self._lock.release()
+
+	def resetStats(self):
+		"""Resets the hit & miss counters
+		"""
+		self.hits = 0
+		self.misses = 0
+
+	def stats(self):
+		"""Returns a dict with the cache's 'hits', 'misses', 'hit_rate' (0. - 1.), 'size' & 'maxsize'
+		"""
+		lookups = self.hits + self.misses
+		if lookups:
+			hit_rate = float(self.hits) / lookups
+		else:
+			hit_rate = 0.
+
+		return {'hits':self.hits, 'misses':self.misses, 'hit_rate':hit_rate, 'size':len(self._items), 'maxsize':self.maxsize}
+
+	def __str__(self):
+		"""Returns the cache's statistics as a string
+		"""
+		return "%s %s" % (self.__class__.__name__, str(self.stats()))
+
+# matches runs of fixed-width typetags, or any single other typetag
+_typetagRuns = re.compile("[ifd]+|.", re.S)
+
+# matches runs of equal fixed-width typetags, or any single other typetag
+_typetagArrayRuns = re.compile("i+|f+|d+|.", re.S)
+
+global signatureCache
+signatureCache = LRUCache(256)
+
+def _getSignature(typetags, homogeneous=False):
+	"""Returns the signature of the typetag-string 'typetags' (without the leading ','), from the signatureCache.
+	The signature is a (binary typetag-string, runs) tuple, where 'runs' is a list of (start, end, struct, offsets) tuples.
+	Each run of fixed-width arguments typetags[start:end] is en- or decoded by a single precompiled 'struct',
+	at the given byte-'offsets' from the start of the run. For other arguments, 'struct' is None.
+	If 'homogeneous' is True, the runs of fixed-width arguments only contain equal typetags.
+	"""
+	if homogeneous:
+		key = (typetags, True)
+	else:
+		key = typetags
+
+	signature = signatureCache.get(key)
+	if signature != None:
+		return signature
+
+	if homogeneous:
+		pattern = _typetagArrayRuns
+	else:
+		pattern = _typetagRuns
+
+	runs = []
+	for match in pattern.finditer(typetags):
+		run = match.group()
+		if run[0] in _fixedWidthStructs:
+			offsets = [0]
+			for tag in run[:-1]:
+				offsets.append(offsets[-1] + _fixedWidthStructs[tag].size)
+			runs.append((match.start(), match.end(), struct.Struct(">" + run), tuple(offsets)))
+		else:
+			runs.append((match.start(), match.end(), None, (0,)))
+
+	signature = (OSCString("," + typetags), runs)
+	signatureCache[key] = signature
+	return signature
+
 ######
 #
 # OSCMessage encoding functions
@@ -769,39 +1313,182 @@ def OSCArgument(next, typehint=None):
 
 	return (tag, binary)
 
-def OSCTimeTag(time):
-	"""Convert a time in floating seconds to its
-	OSC binary representation
+def _normalizeArgument(next, typehint=None):
+	"""Convert some Python types to the value an OSC-receiver
+	would decode from their OSC binary representation, returning a
+	(typetag, value) tuple. (see OSCArgument(), above)
 	"""
-	if time > 0:
-		fract, secs = math.modf(time)
-		secs = secs - NTP_epoch
-		binary = struct.pack('>LL', long(secs), long(fract * NTP_units_per_second))
-	else:
-		binary = struct.pack('>LL', 0L, 1L)
+	if typehint == 'b':
+		if isinstance(next, memoryview):
+			next = next.tobytes()
 
-	return binary
-
-######
-#
-# OSCMessage decoding functions
-#
-######
+		if type(next) in types.StringTypes or isinstance(next, bytearray):
+			next = str(next)
+			return ('b', next + "\0" * (-len(next) % 4))
+		else:
+			return ('b', "")
 
-def _readString(data):
-	"""Reads the next (null-terminated) block of data
-	"""
-	length   = string.find(data,"\0")
-	nextData = int(math.ceil((length+1) / 4.0) * 4)
-	return (data[0:length], data[nextData:])
+	if typehint == 't':
+		return ('t', _readTimeTag(OSCTimeTag(next))[0])
 
-def _readBlob(data):
-	"""Reads the next (numbered) block of data
-	"""
-	
-	length   = struct.unpack(">i", data[0:4])[0]
-	nextData = int(math.ceil((length) / 4.0) * 4) + 4
-	return (data[4:length+4], data[nextData:])
+	if not typehint:
+		if type(next) in FloatTypes:
+			return ('f', _float32.unpack(_float32.pack(float(next)))[0])
+		elif type(next) in IntTypes:
+			return ('i', _checkInt32(int(next)))
+
+	elif typehint == 'd':
+		try:
+			return ('d', float(next))
+		except ValueError:
+			pass
+
+	elif typehint == 'f':
+		try:
+			return ('f', _float32.unpack(_float32.pack(float(next)))[0])
+		except ValueError:
+			pass
+
+	elif typehint == 'i':
+		try:
+			return ('i', _checkInt32(int(next)))
+		except ValueError:
+			pass
+
+	# len() raises TypeError for objects that can't be sent as OSC-string, as OSCString() does
+	len(next)
+	return ('s', str(next).split("\0", 1)[0])
+
+def _checkInt32(value):
+	"""Raise struct.error if 'value' doesn't fit in a 32-bit OSC-int
+	"""
+	if not (-0x80000000 <= value <= 0x7fffffff):
+		raise struct.error("'i' format requires -2147483648 <= number <= 2147483647")
+
+	return value
+
+# numpy-dtypes & array.array-typecodes of the fixed-width OSC types, in network byte-order
+_arrayDtypes = {'i':'>i4', 'f':'>f4', 'd':'>f8'}
+_arrayTypecodes = {'i':'i', 'f':'f', 'd':'d'}
+if array.array('i').itemsize != 4:
+	_arrayTypecodes['i'] = 'l'
+
+_inf = float('inf')
+
+def _packArray(values, typehint=None):
+	"""If 'values' is a numpy-array or an array.array of ints or floats, returns a (typetag, values, binary)
+	tuple for all its elements, converted & byteswapped in one go rather than one element at a time.
+	Returns None for anything else, or if some element needs the per-element checks of _normalizeArgument()
+	"""
+	if isinstance(values, array.array):
+		if values.typecode in "fd":
+			kind = 'f'
+		elif values.typecode in "bBhHiIlL":
+			kind = 'i'
+		else:
+			return None
+	elif (_numpy != None) and isinstance(values, _numpy.ndarray) and values.ndim:
+		kind = values.dtype.kind
+		if kind == 'u':
+			kind = 'i'
+		elif kind not in "if":
+			return None
+	else:
+		return None
+	
+	tag = typehint or kind
+	if (tag not in "ifd") or ((tag == 'i') and (kind == 'f')):
+		return None
+	
+	if isinstance(values, array.array):
+		try:
+			packed = array.array(_arrayTypecodes[tag], values)
+		except OverflowError:
+			return None
+		
+		if (tag == 'f') and (kind == 'f') and ((_inf in packed) or (-_inf in packed)):
+			# could be an overflow
+			return None
+		
+		decoded = packed.tolist()
+		if sys.byteorder == 'little':
+			packed.byteswap()
+		
+		return (tag, decoded, packed.tostring())
+	
+	values = values.ravel()
+	if (tag == 'i') and values.size and (values.dtype.itemsize >= 4):
+		if (values.min() < -0x80000000) or (values.max() > 0x7fffffff):
+			return None
+	
+	packed = values.astype(_arrayDtypes[tag])
+	if (tag == 'f') and (kind == 'f') and (_numpy.isinf(packed).sum() != _numpy.isinf(values).sum()):
+		return None
+	
+	return (tag, packed.tolist(), packed.tostring())
+
+def _encodeArgument(tag, value):
+	"""Returns the OSC binary representation of a (typetag, value) pair,
+	as returned by _normalizeArgument()
+	"""
+	if tag == 'i':
+		return _int32.pack(value)
+	elif tag == 'f':
+		return _float32.pack(value)
+	elif tag == 'd':
+		return _float64.pack(value)
+	elif tag == 'b':
+		return OSCBlob(value)
+	elif tag == 't':
+		return OSCTimeTag(value)
+	else:
+		return OSCString(value)
+
+def OSCTimeTag(time):
+	"""Convert a time in floating seconds to its
+	OSC binary representation
+	"""
+	if time > 0:
+		fract, secs = math.modf(time)
+		secs = secs - NTP_epoch
+		binary = struct.pack('>LL', long(secs), long(fract * NTP_units_per_second))
+	else:
+		binary = struct.pack('>LL', 0L, 1L)
+
+	return binary
+
+def _getBinary(msg):
+	"""Returns the binary representation of the given OSCMessage (or OSCBundle).
+	Strings are taken to be OSC-packets that have already been encoded
+	(e.g. by OSCMessageTemplate.pack()), and are returned as-is.
+	"""
+	if isinstance(msg, OSCMessage):
+		return msg.getBinary()
+	elif type(msg) == types.StringType:
+		return msg
+
+	raise TypeError("'msg' argument is not an OSCMessage or OSCBundle object, or an encoded OSC-packet")
+
+######
+#
+# OSCMessage decoding functions
+#
+######
+
+def _readString(data):
+	"""Reads the next (null-terminated) block of data
+	"""
+	length   = string.find(data,"\0")
+	nextData = int(math.ceil((length+1) / 4.0) * 4)
+	return (data[0:length], data[nextData:])
+
+def _readBlob(data):
+	"""Reads the next (numbered) block of data
+	"""
+	
+	length   = struct.unpack(">i", data[0:4])[0]
+	nextData = int(math.ceil((length) / 4.0) * 4) + 4
+	return (data[4:length+4], data[nextData:])
 
 def _readInt(data):
 	"""Tries to interpret the next 4 bytes of the data
@@ -835,7 +1522,7 @@ def _readTimeTag(data):
 	if (high == 0) and (low <= 1):
 		time = 0.0
 	else:
-		time = int(NTP_epoch + high) + float(low / NTP_units_per_second)
+		time = int(NTP_epoch + high) + (float(low) / NTP_units_per_second)
 	rest = data[8:]
 	return (time, rest)
 
@@ -869,12 +1556,104 @@ def _readDouble(data):
 
 	return (float, rest)
 
-def decodeOSC(data):
-	"""Converts a binary OSC message to a Python list. 
+def _readStringAt(data, offset, end):
+	"""Reads the (null-terminated) block of data starting at 'offset'.
+	Returns the string and the offset of the next block.
+	"""
+	length = data.find("\0", offset, end) - offset
+	if length < 0:
+		# as _readString(): no terminator, don't advance
+		return (str(data[offset:end - 1]), offset)
+
+	return (str(data[offset:offset + length]), offset + ((length + 4) & ~3))
+
+def _readBlobAt(data, offset, end):
+	"""Reads the (numbered) block of data starting at 'offset'.
+	Returns the blob and the offset of the next block.
+	"""
+	length = _int32.unpack_from(data, offset)[0]
+	start = offset + 4
+	if not (0 <= length <= end - start):
+		raise OSCError("Invalid blob-length %d at offset %d" % (length, offset))
+	
+	return (str(data[start:start + length]), start + ((length + 3) & ~3))
+
+def _readBlobViewAt(view, offset, end):
+	"""Reads the (numbered) block of data starting at 'offset' of memoryview 'view'.
+	Returns the blob as a memoryview (no data is copied) and the offset of the next block.
+	"""
+	length = _int32.unpack_from(view, offset)[0]
+	start = offset + 4
+	if not (0 <= length <= end - start):
+		raise OSCError("Invalid blob-length %d at offset %d" % (length, offset))
+	
+	return (view[start:start + length], start + ((length + 3) & ~3))
+
+def _readTimeTagAt(data, offset, end):
+	"""Reads the TimeTag starting at 'offset'.
+	Returns the time and the offset of the next block.
+	"""
+	(time, _) = _readTimeTag(data[offset:offset + 8])
+	return (time, offset + 8)
+
+def _readArrayAt(data, offset, tag, count):
+	"""Reads 'count' fixed-width arguments of type 'tag' starting at 'offset'.
+	Returns a read-only numpy-array (in network byte-order) that is a view into 'data'
+	or, if numpy is not available, an array.array holding a copy of the values.
+	"""
+	if _numpy != None:
+		return _numpy.frombuffer(buffer(data), _arrayDtypes[tag], count, offset)
+
+	values = array.array(_arrayTypecodes[tag])
+	values.fromstring(str(data[offset:offset + (count * values.itemsize)]))
+	if sys.byteorder == 'little':
+		values.byteswap()
+
+	return values
+
+def _readArgumentsAt(data, offset, end, typetags, decoded, blobs=None, arrays=0):
+	"""Decodes the arguments described by 'typetags' (without the leading ',')
+	starting at 'offset', and appends them to the 'decoded' list.
+	Runs of fixed-width arguments are unpacked with the precompiled structs of the signature (see _getSignature()).
+	If 'blobs' is a memoryview of 'data', blob-arguments are returned as slices of it.
+	If 'arrays' is non-zero, each run of at least that many equal fixed-width typetags
+	is returned as a single array (see _readArrayAt()).
+	"""
+	readers = _offsetReaders
+	(_, runs) = _getSignature(typetags, arrays != 0)
+	for (start, stop, unpacker, _) in runs:
+		if unpacker != None:
+			if offset + unpacker.size > end:
+				# truncated message; let the old helpers deal with it
+				rest = str(data[offset:end])
+				for tag in typetags[start:]:
+					(value, rest) = _legacyReaders[tag](rest)
+					decoded.append(value)
+				return end - len(rest)
+
+			if arrays and ((stop - start) >= arrays):
+				decoded.append(_readArrayAt(data, offset, typetags[start], stop - start))
+			else:
+				decoded.extend(unpacker.unpack_from(data, offset))
+			offset += unpacker.size
+		elif (typetags[start] == 'b') and (blobs != None):
+			(value, offset) = _readBlobViewAt(blobs, offset, end)
+			decoded.append(value)
+		else:
+			(value, offset) = readers[typetags[start]](data, offset, end)
+			decoded.append(value)
+
+	return offset
+
+_offsetReaders = {'s':_readStringAt, 'b':_readBlobAt, 't':_readTimeTagAt}
+_legacyReaders = {"i":_readInt, "f":_readFloat, "s":_readString, "b":_readBlob, "d":_readDouble, "t":_readTimeTag}
+
+def _decodeOSC(data, start, end, blobs=None, arrays=0):
+	"""Converts the binary OSC-packet found between offsets 'start' and 'end' of 'data'
+	to a Python list. (see decodeOSC())
 	"""
-	table = {"i":_readInt, "f":_readFloat, "s":_readString, "b":_readBlob, "d":_readDouble, "t":_readTimeTag}
 	decoded = []
-	address,  rest = _readString(data)
+	(address, offset) = _readStringAt(data, start, end)
 	if address.startswith(","):
 		typetags = address
 		address = ""
@@ -882,28 +1661,197 @@ def decodeOSC(data):
 		typetags = ""
 
 	if address == "#bundle":
-		time, rest = _readTimeTag(rest)
+		(time, offset) = _readTimeTagAt(data, offset, end)
 		decoded.append(address)
 		decoded.append(time)
-		while len(rest)>0:
-			length, rest = _readInt(rest)
-			decoded.append(decodeOSC(rest[:length]))
-			rest = rest[length:]
+		while (offset + 4) <= end:
+			length = _int32.unpack_from(data, offset)[0]
+			offset += 4
+			if not (0 <= length <= end - offset):
+				raise OSCError("Invalid bundle-element length %d at offset %d" % (length, offset - 4))
+			
+			decoded.append(_decodeOSC(data, offset, min(offset + length, end), blobs, arrays))
+			offset += length
 
-	elif len(rest)>0:
+	elif offset < end:
 		if not len(typetags):
-			typetags, rest = _readString(rest)
+			(typetags, offset) = _readStringAt(data, offset, end)
 		decoded.append(address)
 		decoded.append(typetags)
 		if typetags.startswith(","):
-			for tag in typetags[1:]:
-				value, rest = table[tag](rest)
-				decoded.append(value)
+			_readArgumentsAt(data, offset, end, typetags[1:], decoded, blobs, arrays)
 		else:
 			raise OSCError("OSCMessage's typetag-string lacks the magic ','")
 
 	return decoded
 
+def decodeOSC(data, blob_views=False, array_runs=0):
+	"""Converts a binary OSC message to a Python list.
+	'data' can be a string, a bytearray or a memoryview. The packet is decoded in a single pass,
+	reading each field at its offset in 'data' instead of slicing off the remainder after every field.
+
+	If 'blob_views' is True, blob-arguments are returned as read-only memoryviews into 'data',
+	instead of being copied into new strings. These views are only valid while 'data' is:
+	'data' must not be modified (or resized) while any of the views are in use, and an OSCServer
+	may reuse its receive-buffer as soon as the callback that got the views returns.
+	Callbacks that need to keep blob-data around should copy it with copyBlob().
+	A memoryview 'data' is copied into a string first (Python 2's memoryview can't be searched for
+	the strings' ends, and numpy can't read it), and everything but the blobs is decoded from that copy.
+	The blob-views are still slices of the (1-dimensional, bytes) memoryview itself, not of the copy;
+	they're writable if it is.
+
+	If 'array_runs' is non-zero, every run of at least that many equal 'i', 'f' or 'd' typetags
+	is returned as a single numpy-array (a read-only view into 'data', or into the copy of a memoryview,
+	with the same lifetime as blob-views, above), or as an array.array if numpy is not available, instead of as separate values.
+	The typetag-string still lists every argument, so the decoded list may be shorter than it.
+	"""
+	blobs = None
+	if isinstance(data, memoryview):
+		if blob_views and (data.ndim == 1) and (data.itemsize == 1):
+			blobs = data
+		
+		data = data.tobytes()
+
+	if blob_views and (blobs == None):
+		blobs = memoryview(buffer(data))
+
+	return _decodeOSC(data, 0, len(data), blobs, array_runs)
+
+class _LazyMessage(object):
+	"""An OSC-message of which only the address has been decoded (see _scanOSC())
+	"""
+	__slots__ = ('address', 'data', 'start', 'end', 'offset')
+	
+	def __init__(self, address, data, start, end, offset):
+		self.address = address
+		self.data = data
+		self.start = start
+		self.end = end
+		
+		# where the typetag-string starts
+		self.offset = offset
+	
+	def decode(self, blob_views=False, array_runs=0):
+		"""Decodes the whole message. Returns the same list decodeOSC() returns for it
+		"""
+		if blob_views:
+			blobs = memoryview(buffer(self.data))
+		else:
+			blobs = None
+		
+		return _decodeOSC(self.data, self.start, self.end, blobs, array_runs)
+
+def _scanOSC(data, start, end):
+	"""Decodes only the bundle-structure of the binary OSC-packet found between offsets 'start' and 'end' of 'data'.
+	Returns a list like decodeOSC() does for bundles, but with each OSC-message as a _LazyMessage,
+	whose arguments are only decoded when its decode() method is called.
+	Returns an empty list if the packet is empty (or holds just an address).
+	"""
+	(address, offset) = _readStringAt(data, start, end)
+	if address == "#bundle":
+		(time, offset) = _readTimeTagAt(data, offset, end)
+		scanned = [address, time]
+		while (offset + 4) <= end:
+			length = _int32.unpack_from(data, offset)[0]
+			offset += 4
+			if not (0 <= length <= end - offset):
+				raise OSCError("Invalid bundle-element length %d at offset %d" % (length, offset - 4))
+			
+			scanned.append(_scanOSC(data, offset, min(offset + length, end)))
+			offset += length
+		
+		return scanned
+	
+	if address.startswith(","):
+		# no address at all
+		return _LazyMessage("", data, start, end, start)
+	
+	if offset < end:
+		return _LazyMessage(address, data, start, end, offset)
+	
+	return []
+
+def _getArgumentDecoder(typetags):
+	"""Returns a function that decodes the arguments of a message with the given typetag-string
+	(without the leading ','), starting at 'offset' of 'data', into a tuple.
+	The function takes (data, offset, end, blobs) arguments, like _readArgumentsAt(),
+	and returns None if the message is too short to hold the arguments.
+	"""
+	(_, runs) = _getSignature(typetags)
+	if not len(runs):
+		return lambda data, offset, end, blobs=None: ()
+	
+	if (len(runs) == 1) and (runs[0][2] != None):
+		# fixed-width arguments only; a single struct does it
+		unpacker = runs[0][2]
+		size = unpacker.size
+		unpack_from = unpacker.unpack_from
+		def decode(data, offset, end, blobs=None):
+			if offset + size > end:
+				return None
+			return unpack_from(data, offset)
+		
+		return decode
+	
+	def decode(data, offset, end, blobs=None):
+		args = []
+		_readArgumentsAt(data, offset, end, typetags, args, blobs)
+		return tuple(args)
+	
+	return decode
+
+def _expandArrays(data):
+	"""Returns the list of decoded arguments 'data' with any arrays (see decodeOSC()'s 'array_runs')
+	replaced by their values
+	"""
+	out = []
+	for value in data:
+		if _isArray(value):
+			out.extend(value.tolist())
+		else:
+			out.append(value)
+	
+	return out
+
+def copyBlob(blob):
+	"""Returns a copy (string) of a blob-argument which may be a memoryview into a receive-buffer,
+	as returned by decodeOSC() with 'blob_views' set (see there).
+	Other values are returned as-is, so 'map(copyBlob, data)' copies all blobs in a message's arguments.
+	"""
+	if isinstance(blob, memoryview):
+		return blob.tobytes()
+
+	return blob
+
+def _isArray(value):
+	"""Returns True if 'value' is an array.array or a numpy-array, as returned by decodeOSC() for
+	runs of equal arguments (see there)
+	"""
+	return isinstance(value, array.array) or ((_numpy != None) and isinstance(value, _numpy.ndarray))
+
+def _reencapsulate(decoded):
+	"""Converts a decoded OSC-packet (as returned by decodeOSC()) back
+	to an OSCMessage or OSCBundle
+	"""
+	if decoded[0] == "#bundle":
+		msg = OSCBundle()
+		msg.setTimeTag(decoded[1])
+		for submsg in decoded[2:]:
+			msg.append(_reencapsulate(submsg))
+
+	else:
+		msg = OSCMessage(decoded[0])
+		tags = decoded[1].lstrip(',')
+		i = 0
+		for value in decoded[2:]:
+			msg.append(value, tags[i])
+			if _isArray(value):
+				i += len(value)
+			else:
+				i += 1
+
+	return msg
+
 ######
 #
 # Utility functions
@@ -1168,8 +2116,7 @@ class OSCClient(object):
 		  	this call blocks until socket is available for writing. 
 		Raises OSCClientError when timing out while waiting for the socket. 
 		"""
-		if not isinstance(msg, OSCMessage):
-			raise TypeError("'msg' argument is not an OSCMessage or OSCBundle object")
+		binary = _getBinary(msg)
 
 		ret = select.select([],[self._fd], [], timeout)
 		try:
@@ -1179,11 +2126,15 @@ class OSCClient(object):
 			raise OSCClientError("Timed out waiting for file descriptor")
 		
 		try:
-			self._ensureConnected(address)
-			self.socket.sendall(msg.getBinary())
-			
-			if self.client_address:
-				self.socket.connect(self.client_address)
+			if (self.server != None) and not self.client_address:
+				# don't connect the Server's socket to 'address'; it would only receive from there after that
+				self.socket.sendto(binary, address)
+			else:
+				self._ensureConnected(address)
+				self.socket.sendall(binary)
+				
+				if self.client_address:
+					self.socket.connect(self.client_address)
 			
 		except socket.error, e:
 			if e[0] in (7, 65):	# 7 = 'no address associated with nodename',  65 = 'no route to host'
@@ -1200,8 +2151,7 @@ class OSCClient(object):
 		Raises OSCClientError when timing out while waiting for the socket,
 		or when the Client isn't connected to a remote server.
 		"""
-		if not isinstance(msg, OSCMessage):
-			raise TypeError("'msg' argument is not an OSCMessage or OSCBundle object")
+		binary = _getBinary(msg)
 
 		if not self.socket:
 			raise OSCClientError("Called send() on non-connected client")
@@ -1214,7 +2164,7 @@ class OSCClient(object):
 			raise OSCClientError("Timed out waiting for file descriptor")
 		
 		try:
-			self.socket.sendall(msg.getBinary())
+			self.socket.sendall(binary)
 		except socket.error, e:
 			if e[0] in (7, 65):	# 7 = 'no address associated with nodename',  65 = 'no route to host'
 				raise e
@@ -1311,6 +2261,240 @@ def getRegEx(pattern):
 	pattern = pattern.translate(OSCtrans)		# change '?' to '.' and '{,}' to '(|)'
 	
 	return re.compile(pattern)
+
+######
+#
+# OSC address-pattern matching
+#
+######
+
+# matches any of the characters that make an OSC-address part a pattern
+_wildcardChars = re.compile(r"[*?\[\]{}]")
+
+# token-types of a compiled address-part
+_LITERAL, _ANYCHAR, _CHARSET, _ANYSTRING, _CHOICE = range(5)
+
+def _tokenizePart(part):
+	"""Splits a single OSC-address part (containing no '/') into a list of (type, argument) tokens.
+	'[' or '{' without a closing ']' or '}' are taken literally.
+	"""
+	tokens = []
+	literal = ""
+	i = 0
+	while i < len(part):
+		c = part[i]
+		if c == '[' and ']' in part[i + 2:]:
+			end = part.index(']', i + 2)
+			chars = part[i + 1:end]
+			negate = chars.startswith('!')
+			if negate:
+				chars = chars[1:]
+			
+			charset = set()
+			j = 0
+			while j < len(chars):
+				if (j + 2 < len(chars)) and (chars[j + 1] == '-'):
+					(lo, hi) = sorted((ord(chars[j]), ord(chars[j + 2])))
+					charset.update(map(chr, range(lo, hi + 1)))
+					j += 3
+				else:
+					charset.add(chars[j])
+					j += 1
+			
+			token = (_CHARSET, (frozenset(charset), negate))
+			i = end + 1
+		elif c == '{' and '}' in part[i:]:
+			end = part.index('}', i)
+			token = (_CHOICE, tuple(part[i + 1:end].split(',')))
+			i = end + 1
+		elif c == '?':
+			token = (_ANYCHAR, None)
+			i += 1
+		elif c == '*':
+			token = (_ANYSTRING, None)
+			while i < len(part) and part[i] == '*':
+				i += 1
+		else:
+			literal += c
+			i += 1
+			continue
+		
+		if len(literal):
+			tokens.append((_LITERAL, literal))
+			literal = ""
+		
+		tokens.append(token)
+	
+	if len(literal):
+		tokens.append((_LITERAL, literal))
+	
+	return tokens
+
+def _matchTokens(tokens, t, key, pos):
+	"""Returns True if 'key', from index 'pos' onwards, is matched by the tokens from index 't' onwards.
+	Backtracks over '*' and '{,}'
+	"""
+	while t < len(tokens):
+		(kind, arg) = tokens[t]
+		if kind == _LITERAL:
+			if not key.startswith(arg, pos):
+				return False
+			pos += len(arg)
+		elif kind == _ANYCHAR:
+			if pos >= len(key):
+				return False
+			pos += 1
+		elif kind == _CHARSET:
+			if (pos >= len(key)) or ((key[pos] in arg[0]) == arg[1]):
+				return False
+			pos += 1
+		elif kind == _CHOICE:
+			for choice in arg:
+				if key.startswith(choice, pos) and _matchTokens(tokens, t + 1, key, pos + len(choice)):
+					return True
+			return False
+		else:
+			if t + 1 == len(tokens):
+				return True
+			for p in xrange(pos, len(key) + 1):
+				if _matchTokens(tokens, t + 1, key, p):
+					return True
+			return False
+		
+		t += 1
+	
+	return pos == len(key)
+
+def _matchAny(key):
+	return True
+
+def _compilePart(part):
+	"""Compiles a single OSC-address part (containing no '/') for matching.
+	Returns the part itself if it contains no wildcards (match it with '=='),
+	else a function that takes an address-part and returns True if it matches.
+	The common shapes of pattern get a matcher built from plain string-methods.
+	"""
+	if not _wildcardChars.search(part):
+		return part
+	
+	tokens = _tokenizePart(part)
+	kinds = [kind for (kind, arg) in tokens]
+	
+	if kinds == [_ANYSTRING]:
+		return _matchAny
+	
+	if _CHOICE in kinds and not (set(kinds) - set((_LITERAL, _CHOICE))):
+		# only literals & choices; expand into the set of all strings matched
+		choices = [""]
+		for (kind, arg) in tokens:
+			if kind == _LITERAL:
+				arg = (arg,)
+			choices = [head + tail for head in choices for tail in arg]
+		
+		if len(choices) <= 256:
+			return frozenset(choices).__contains__
+	
+	if kinds in ([_LITERAL, _ANYSTRING], [_ANYSTRING, _LITERAL], [_LITERAL, _ANYSTRING, _LITERAL]):
+		prefix = suffix = ""
+		if kinds[0] == _LITERAL:
+			prefix = tokens[0][1]
+		if kinds[-1] == _LITERAL:
+			suffix = tokens[-1][1]
+		
+		minlen = len(prefix) + len(suffix)
+		return lambda key: (len(key) >= minlen) and key.startswith(prefix) and key.endswith(suffix)
+	
+	if _ANYSTRING not in kinds and _CHOICE not in kinds:
+		# a fixed-length pattern; reject keys of the wrong length before looking at any characters
+		length = 0
+		for (kind, arg) in tokens:
+			if kind == _LITERAL:
+				length += len(arg)
+			else:
+				length += 1
+		
+		return lambda key: (len(key) == length) and _matchTokens(tokens, 0, key, 0)
+	
+	return lambda key: _matchTokens(tokens, 0, key, 0)
+
+class OSCPattern(object):
+	"""A compiled OSC address-pattern, as per the OSC 1.0 spec:
+	  - '?' matches any single character
+	  - '*' matches any sequence of zero or more characters
+	  - '[abc]' or '[a-z]' matches any single character in the list or range, and
+	  - '[!abc]' matches any single character that's NOT in the list or range
+	  - '{foo,bar}' matches any of the comma-separated strings
+	Matching is done part by part, so a wildcard never matches the '/' between address-parts,
+	and no regular expressions are involved.
+	  >>> OSCPattern("/ch/[1-4]/*").match("/ch/2/fader")
+	  True
+	  >>> OSCPattern("/ch/*").match("/ch/2/fader")
+	  False
+	"""
+	def __init__(self, pattern):
+		self.pattern = pattern
+		
+		# one entry per address-part; a plain string for parts without wildcards, else a match-function
+		self.parts = [_compilePart(part) for part in pattern.split('/')]
+		
+		self._literals = []
+		self._matchers = []
+		for (i, matcher) in enumerate(self.parts):
+			if type(matcher) == types.StringType:
+				self._literals.append((i, matcher))
+			elif matcher != _matchAny:
+				self._matchers.append((i, matcher))
+		
+		# the literal parts before the first & after the last wildcard-part, for rejecting most addresses without splitting them
+		literal = [type(matcher) == types.StringType for matcher in self.parts]
+		if False in literal:
+			first = literal.index(False)
+			last = len(literal) - literal[::-1].index(False)
+			self._prefix = "/".join(self.parts[:first] + [""])
+			self._suffix = "/".join([""] + self.parts[last:])
+		else:
+			self._prefix = self._suffix = None
+	
+	def match(self, address):
+		"""Returns True if the given OSC-address matches this pattern
+		"""
+		if self._prefix == None:
+			return address == self.pattern
+		
+		if not (address.startswith(self._prefix) and address.endswith(self._suffix)):
+			return False
+		
+		parts = address.split('/')
+		if len(parts) != len(self.parts):
+			return False
+		
+		# the cheap string-compares first
+		for (i, literal) in self._literals:
+			if parts[i] != literal:
+				return False
+		
+		for (i, matcher) in self._matchers:
+			if not matcher(parts[i]):
+				return False
+		
+		return True
+	
+	def __repr__(self):
+		return "%s(%s)" % (self.__class__.__name__, repr(self.pattern))
+
+global patternCache
+patternCache = LRUCache(512)
+
+def getPattern(pattern):
+	"""Returns the compiled OSCPattern object for the given address-pattern from the patternCache,
+	compiling it if it's not there
+	"""
+	compiled = patternCache.get(pattern)
+	if compiled == None:
+		compiled = OSCPattern(pattern)
+		patternCache[pattern] = compiled
+
+	return compiled
 	
 ######
 #
@@ -1584,12 +2768,11 @@ class OSCMultiClient(OSCClient):
 		"""
 		if isinstance(msg, OSCBundle):
 			out = msg.copy()
-			msgs = out.values()
 			out.clearData()
-			for m in msgs:
+			for m in msg._args:
 				m = self._filterMessage(filters, m)
 				if m:		# this catches 'None' and empty bundles.
-					out.append(m)
+					out._appendItem('b', m)
 					
 		elif isinstance(msg, OSCMessage):
 			if '/*' in filters.keys():
@@ -1606,14 +2789,13 @@ class OSCMultiClient(OSCClient):
 		else:
 			raise TypeError("'msg' argument is not an OSCMessage or OSCBundle object")
 
-		expr = getRegEx(msg.address)
+		pattern = getPattern(msg.address)
 
 		for addr in filters.keys():
 			if addr == '/*':
 				continue
 			
-			match = expr.match(addr)
-			if match and (match.end() == len(addr)):
+			if pattern.match(addr):
 				if filters[addr]:
 					out = msg
 				else:
@@ -1630,10 +2812,9 @@ class OSCMultiClient(OSCClient):
 		out = msg.copy()
 		
 		if isinstance(msg, OSCBundle):
-			msgs = out.values()
 			out.clearData()
-			for m in msgs:
-				out.append(self._prefixAddress(prefix, m))
+			for m in msg._args:
+				out._appendItem('b', self._prefixAddress(prefix, m))
 
 		elif isinstance(msg, OSCMessage):
 			out.setAddress(prefix + out.address)
@@ -1650,6 +2831,13 @@ class OSCMultiClient(OSCClient):
 		  	this call blocks until socket is available for writing. 
 		Raises OSCClientError when timing out while waiting for	the socket.
 		"""
+		if not isinstance(msg, OSCMessage):
+			# a pre-encoded packet only needs decoding if some target filters or prefixes messages
+			for (prefix, filters) in self.targets.values():
+				if len(prefix) or len(filters):
+					msg = _reencapsulate(decodeOSC(_getBinary(msg)))
+					break
+
 		for (address, (prefix, filters)) in self.targets.items():
 			if len(filters):
 				out = self._filterMessage(filters, msg)
@@ -1659,9 +2847,9 @@ class OSCMultiClient(OSCClient):
 				out = msg
 
 			if len(prefix):
-				out = self._prefixAddress(prefix, msg)
+				out = self._prefixAddress(prefix, out)
 
-			binary = out.getBinary()
+			binary = _getBinary(out)
 			
 			ret = select.select([],[self._fd], [], timeout)
 			try:
@@ -1681,77 +2869,1012 @@ class OSCMultiClient(OSCClient):
 				else:
 					raise OSCClientError("while sending to %s: %s" % (str(address), str(e)))
 
-class OSCAddressSpace:
+class _PatternNode(object):
+	"""A node of the tree of OSC address-patterns registered with OSCAddressSpace.addMsgHandler()
+	"""
+	__slots__ = ('literal', 'wildcard', 'address')
+	
 	def __init__(self):
-		self.callbacks = {}
-	def addMsgHandler(self, address, callback):
-		"""Register a handler for an OSC-address
-		  - 'address' is the OSC address-string. 
-		the address-string should start with '/' and may not contain '*'
-		  - 'callback' is the function called for incoming OSCMessages that match 'address'.
-		The callback-function will be called with the same arguments as the 'msgPrinter_handler' below
+		# child-nodes per literal address-part
+		self.literal = {}
+		# (matcher, child-node) tuples per wildcard address-part (see _compilePart())
+		self.wildcard = {}
+		# the pattern registered at this node, if any
+		self.address = None
+	
+	def copy(self):
+		"""Returns a copy of this node, sharing its child-nodes
 		"""
-		for chk in '*?,[]{}# ':
-			if chk in address:
-				raise OSCServerError("OSC-address string may not contain any characters in '*?,[]{}# '")
+		node = _PatternNode()
+		node.literal = dict(self.literal)
+		node.wildcard = dict(self.wildcard)
+		node.address = self.address
+		return node
+	
+	def isEmpty(self):
+		return (self.address == None) and not (len(self.literal) or len(self.wildcard))
+
+class _AddressSpaceSnapshot(object):
+	"""The state of an OSCAddressSpace: its callbacks, the trees indexing their addresses & patterns,
+	and the matchCache. A snapshot is never changed once an OSCAddressSpace uses it;
+	adding or removing a handler builds a changed copy, and replaces the snapshot with it.
+	"""
+	__slots__ = ('callbacks', 'addressTree', 'patterns', 'patternTree', 'typed', 'batched', 'matchCache', 'owned')
+	
+	def __init__(self, match_cache_size):
+		self.callbacks = {}
 		
-		if type(callback) not in (types.FunctionType, types.MethodType):
-			raise OSCServerError("Message callback '%s' is not callable" % repr(callback))
+		# the registered addresses, in a tree of dicts with one level per address-part
+		self.addressTree = {}
 		
-		if address != 'default':
-			address = '/' + address.strip('/')
-			
-		self.callbacks[address] = callback
+		# the address-patterns callbacks are registered for, and the tree indexing them
+		self.patterns = set()
+		self.patternTree = _PatternNode()
 		
-	def delMsgHandler(self, address):
-		"""Remove the registered handler for the given OSC-address
+		# (typetags, binary typetag-string, argument-decoder) per address registered with addTypedMsgHandler()
+		self.typed = {}
+		
+		# the addresses registered with addBatchMsgHandler()
+		self.batched = set()
+		
+		self.matchCache = LRUCache(match_cache_size)
+		
+		# the tree-nodes this snapshot copied while being changed, by id(); None once it's in use
+		self.owned = None
+	
+	def copy(self):
+		"""Returns a copy of this snapshot, to be changed before it's used, with an empty matchCache.
+		The trees are shared with this snapshot; change them with addAddress() & delAddress() only,
+		which copy the nodes they change (each node only once, however many addresses are changed).
+		Call release() when done changing the copy.
 		"""
-		del self.callbacks[address]
+		space = _AddressSpaceSnapshot(self.matchCache.maxsize)
+		space.callbacks = dict(self.callbacks)
+		space.addressTree = self.addressTree
+		space.patterns = set(self.patterns)
+		space.patternTree = self.patternTree
+		space.typed = dict(self.typed)
+		space.batched = set(self.batched)
+		space.owned = {}
+		return space
 	
-	def getOSCAddressSpace(self):
-		"""Returns a list containing all OSC-addresses registerd with this Server. 
+	def release(self):
+		"""Marks the end of the changes to this snapshot, before it's used
 		"""
-		return self.callbacks.keys()
+		self.owned = None
 	
-	def dispatchMessage(self, pattern, tags, data, client_address):
-		"""Attmept to match the given OSC-address pattern, which may contain '*',
-		against all callbacks registered with the OSCServer.
-		Calls the matching callback and returns whatever it returns.
-		If no match is found, and a 'default' callback is registered, it calls that one,
-		or raises NoCallbackError if a 'default' callback is not registered.
-		
-		  - pattern (string):  The OSC-address of the receied message
-		  - tags (string):  The OSC-typetags of the receied message's arguments, without ','
-		  - data (list):  The message arguments
+	def own(self, node):
+		"""Returns the given tree-node (a _PatternNode or a dict) if this snapshot copied it already,
+		or else a copy of it that this snapshot can change
 		"""
-		if len(tags) != len(data):
-			raise OSCServerError("Malformed OSC-message; got %d typetags [%s] vs. %d values" % (len(tags), tags, len(data)))
+		if id(node) not in self.owned:
+			if isinstance(node, _PatternNode):
+				node = node.copy()
+			else:
+				node = dict(node)
+			
+			self.owned[id(node)] = node
+		
+		return node
+	
+	def addAddress(self, address):
+		"""Adds the given (normalized) OSC-address or -pattern to the right tree
+		"""
+		if _wildcardChars.search(address):
+			root = node = self.own(self.patternTree)
+			for part in address[1:].split('/'):
+				if _wildcardChars.search(part):
+					if part in node.wildcard:
+						(matcher, child) = node.wildcard[part]
+						child = self.own(child)
+					else:
+						(matcher, child) = (_compilePart(part), self.own(_PatternNode()))
+					
+					node.wildcard[part] = (matcher, child)
+				else:
+					child = self.own(node.literal.get(part, _PatternNode()))
+					node.literal[part] = child
+				
+				node = child
+			
+			node.address = address
+			self.patterns.add(address)
+			self.patternTree = root
+		else:
+			root = node = self.own(self.addressTree)
+			for part in address[1:].split('/'):
+				child = self.own(node.get(part, {}))
+				node[part] = child
+				node = child
+			
+			node[None] = address
+			self.addressTree = root
+	
+	def delAddress(self, address):
+		"""Removes the given OSC-address or -pattern from its tree, and any branches left empty
+		"""
+		parts = address[1:].split('/')
+		
+		if address in self.patterns:
+			self.patterns.remove(address)
+			
+			path = []
+			root = node = self.own(self.patternTree)
+			for part in parts:
+				path.append((node, part))
+				if part in node.literal:
+					node.literal[part] = self.own(node.literal[part])
+					node = node.literal[part]
+				else:
+					(matcher, child) = node.wildcard[part]
+					node.wildcard[part] = (matcher, self.own(child))
+					node = node.wildcard[part][1]
+			
+			node.address = None
+			
+			for (parent, part) in reversed(path):
+				if not node.isEmpty():
+					break
+				
+				if part in parent.literal:
+					del parent.literal[part]
+				else:
+					del parent.wildcard[part]
+				
+				node = parent
+			
+			self.patternTree = root
+		else:
+			path = [self.own(self.addressTree)]
+			for part in parts:
+				path[-1][part] = self.own(path[-1][part])
+				path.append(path[-1][part])
+			
+			root = path[0]
+			del path[-1][None]
+			
+			for part in reversed(parts):
+				if len(path.pop()):
+					break
+				del path[-1][part]
+			
+			self.addressTree = root
+
+class OSCAddressSpace:
+	"""The set of OSC-addresses a server (or streaming client) has registered callbacks for.
+	Besides the 'callbacks' dict, the addresses are indexed in a tree with one level per address-part,
+	so an incoming address-pattern only has to be matched against the addresses that can match it:
+	literal parts are looked up directly, and wildcard parts are only matched against the parts
+	found at that level of the tree. As the OSC-spec prescribes, wildcards match within one address-part.
+	
+	Callbacks can also be registered for address-patterns (like '/user/*' or '/ch/[0-9]*/gain'),
+	which are indexed in a second tree. An incoming message is handled by:
+	  - the callbacks registered for the OSC-addresses its address(-pattern) matches, or else
+	  - the callbacks registered for the address-patterns its address matches, or else
+	  - the 'default' callback, if any.
+	Registered patterns are only matched against plain addresses, never against incoming patterns.
+	
+	The addresses matched by recently received wildcard-patterns, and the patterns matching recently
+	received addresses, are remembered in the 'matchCache', which is emptied whenever a handler is added or removed.
+	
+	All of this is kept in a snapshot that is never changed while in use: adding or removing a handler
+	builds a changed copy, and then swaps it in. Dispatching a message uses the snapshot current when it started,
+	without locking it, so handlers can be added & removed while other threads are dispatching.
+	(Looking up the matchCache doesn't lock either; only storing a newly matched pattern in it does, see LRUCache)
+	The 'callbacks' dict is read-only; use addMsgHandler() & delMsgHandler() to change it,
+	or addMsgHandlers() & delMsgHandlers() to register or remove many handlers with a single copy.
+	"""
+	# the max. number of wildcard-patterns to remember the matching addresses of
+	match_cache_size = 256
+	
+	# the decoding-options of the servers & clients dispatching received messages to the address-space:
+	# pass blob-arguments to callbacks as memoryviews into the received packet?
+	# (see decodeOSC() for how long these views stay valid, and copyBlob())
+	blob_views = False
+	
+	# pass runs of at least this many equal int/float/double arguments to callbacks
+	# as a single numpy-array (or array.array)? 0 = no. (see decodeOSC())
+	array_runs = 0
+	
+	def __init__(self):
+		self._space = _AddressSpaceSnapshot(self.match_cache_size)
+		
+		# serializes the changes to the address-space; dispatching doesn't need it
+		self._spaceLock = threading.Lock()
+	
+	def _getCallbacks(self):
+		return self._space.callbacks
+	
+	callbacks = property(_getCallbacks, doc="The dict of callbacks per registered OSC-address (read-only)")
+	
+	def _getMatchCache(self):
+		return self._space.matchCache
+	
+	matchCache = property(_getMatchCache, doc="The LRUCache of addresses matched per recently received pattern")
+	
+	def _checkHandler(self, address, callback):
+		"""Raises OSCServerError if a handler can't be registered for the given OSC-address and callback
+		"""
+		for chk in '# ':
+			if chk in address:
+				raise OSCServerError("OSC-address string may not contain any characters in '# '")
+		
+		if ',' in re.sub(r"{[^{}]*}", "", address):
+			raise OSCServerError("OSC-address string may only contain ',' within '{}'")
+		
+		if type(callback) not in (types.FunctionType, types.MethodType):
+			raise OSCServerError("Message callback '%s' is not callable" % repr(callback))
+	
+	def _changeSpace(self, handlers=(), removed=()):
+		"""Register the (address, callback, typed, batched) handlers in 'handlers', and remove the handlers
+		for the OSC-addresses in 'removed', replacing the snapshot of the address-space with a changed copy
+		just once for all of them. Returns the list of normalized addresses of 'handlers'
+		"""
+		addresses = []
+		
+		self._spaceLock.acquire()
+		try:
+			space = self._space.copy()
+			for (address, callback, typed, batched) in handlers:
+				if address != 'default':
+					address = '/' + address.strip('/')
+					if address not in space.callbacks:
+						space.addAddress(address)
+				
+				space.callbacks[address] = callback
+				
+				space.typed.pop(address, None)
+				if typed != None:
+					space.typed[address] = typed
+				
+				space.batched.discard(address)
+				if batched:
+					space.batched.add(address)
+				
+				addresses.append(address)
+			
+			for address in removed:
+				del space.callbacks[address]
+				space.typed.pop(address, None)
+				space.batched.discard(address)
+				
+				if address != 'default':
+					space.delAddress(address)
+			
+			space.release()
+			self._space = space
+		finally:
+			self._spaceLock.release()
+		
+		return addresses
+	
+	def _setHandler(self, address, callback, typed=None, batched=False):
+		"""Register the given callback for the given OSC-address or -pattern, replacing the snapshot
+		of the address-space with a changed copy. Returns the normalized address
+		"""
+		return self._changeSpace([(address, callback, typed, batched)])[0]
+	
+	def addMsgHandler(self, address, callback):
+		"""Register a handler for an OSC-address or -pattern
+		  - 'address' is the OSC address-string.
+		the address-string should start with '/' and may not contain '#' or ' '.
+		It may be an OSC address-pattern (containing '*', '?', '[]' or '{,}', see OSCPattern), in which case
+		the callback handles any incoming message to an address it matches, that no callback is registered for
+		(see OSCAddressSpace for the precedence of callbacks)
+		  - 'callback' is the function called for incoming OSCMessages that match 'address'.
+		The callback-function will be called with the same arguments as the 'msgPrinter_handler' below
+		"""
+		self._checkHandler(address, callback)
+		self._setHandler(address, callback)
+	
+	def addMsgHandlers(self, handlers):
+		"""Register many handlers at once, like addMsgHandler() does for each of them
+		  - 'handlers' is a dict of callbacks per OSC-address (or -pattern), or a list of (address, callback) tuples.
+		Since every change to the address-space copies the part of it that changes (see OSCAddressSpace),
+		this is much faster than calling addMsgHandler() for each of thousands of addresses.
+		"""
+		if isinstance(handlers, dict):
+			handlers = handlers.items()
+		
+		for (address, callback) in handlers:
+			self._checkHandler(address, callback)
+		
+		self._changeSpace([(address, callback, None, False) for (address, callback) in handlers])
+	
+	def addTypedMsgHandler(self, address, typetags, callback):
+		"""Register a handler for an OSC-address, that only handles messages with the given typetags
+		  - 'address' is the OSC address-string (see addMsgHandler())
+		  - 'typetags' is the OSC-typetag string (with or without the leading ',')
+		the expected arguments must have. Messages to this address with other typetags are not handled by it.
+		  - 'callback' is the function called for incoming OSCMessages that match 'address' & 'typetags'.
+		The callback-function is called with the message's arguments as positional arguments:
+		  callback(addr, client_address, arg1, arg2, ...)
+		The arguments of messages sent straight to 'address' are checked & decoded in one go,
+		before any other decoding (when received by an OSCServer).
+		"""
+		typetags = typetags.lstrip(',')
+		for tag in typetags:
+			if tag not in "ifdsbt":
+				raise OSCServerError("Typed message-handlers only support the typetags 'ifdsbt', not '%s'" % tag)
+		
+		self._checkHandler(address, callback)
+		self._setHandler(address, callback, typed=(typetags, _getSignature(typetags)[0], _getArgumentDecoder(typetags)))
+	
+	def addBatchMsgHandler(self, address, callback):
+		"""Register a handler for an OSC-address (or -pattern), that handles a batch of messages per call
+		  - 'address' is the OSC address-string (see addMsgHandler())
+		  - 'callback' is the function called with all messages matching 'address' collected in one go:
+		  callback(address, batch)
+		where 'batch' is a list of (addr, tags, data, client_address) tuples (the arguments a regular callback
+		gets for each message) and 'address' is the address the callback is registered for.
+		An OSCServer collects the messages received in one burst (see OSCServer.handle_request()),
+		or a ThreadingOSCServer those in one packet (bundle), then calls each batch-callback once.
+		Messages dispatched otherwise are passed in a batch of one.
+		Any value the callback returns is ignored; no replies are sent for batched messages.
+		"""
+		if address == 'default':
+			raise OSCServerError("The 'default' callback can't be a batch-callback")
+		
+		self._checkHandler(address, callback)
+		self._setHandler(address, callback, batched=True)
+	
+	def delMsgHandler(self, address):
+		"""Remove the registered handler for the given OSC-address
+		"""
+		self._changeSpace(removed=[address])
+	
+	def delMsgHandlers(self, addresses):
+		"""Remove the registered handlers for all of the given OSC-addresses at once (see addMsgHandlers())
+		"""
+		self._changeSpace(removed=list(addresses))
+	
+	def _matchAddresses(self, pattern, space=None):
+		"""Returns a list of the registered OSC-addresses matched by the given OSC-address pattern,
+		or, if there are none, of the registered address-patterns that match it (see OSCAddressSpace)
+		  - space (_AddressSpaceSnapshot): the snapshot of the address-space to search. Default: the current one
+		"""
+		if space == None:
+			space = self._space
+		
+		if not pattern.startswith('/'):
+			return []
+		
+		if not _wildcardChars.search(pattern):
+			# a plain OSC-address
+			if pattern in space.callbacks:
+				return [pattern]
+			
+			if not len(space.patterns):
+				return []
+			
+			search = self._searchPatterns
+		else:
+			search = self._searchAddresses
+		
+		addresses = space.matchCache.get(pattern)
+		if addresses == None:
+			addresses = search(pattern, space)
+			space.matchCache[pattern] = addresses
+		
+		return addresses
+	
+	def _searchAddresses(self, pattern, space):
+		"""Returns a list of the registered OSC-addresses matched by the given OSC-address pattern,
+		by walking the address-tree
+		"""
+		nodes = [space.addressTree]
+		for matcher in getPattern(pattern).parts[1:]:
+			if type(matcher) == types.StringType:
+				found = [node[matcher] for node in nodes if matcher in node]
+			else:
+				found = []
+				for node in nodes:
+					for (key, child) in node.iteritems():
+						if (key != None) and matcher(key):
+							found.append(child)
+			
+			if not len(found):
+				return []
+			
+			nodes = found
+		
+		return [node[None] for node in nodes if None in node]
+	
+	def _searchPatterns(self, address, space):
+		"""Returns a list of the registered OSC address-patterns matching the given OSC-address,
+		by walking the pattern-tree
+		"""
+		nodes = [space.patternTree]
+		for part in address[1:].split('/'):
+			found = []
+			for node in nodes:
+				if part in node.literal:
+					found.append(node.literal[part])
+				
+				for (matcher, child) in node.wildcard.itervalues():
+					if matcher(part):
+						found.append(child)
+			
+			if not len(found):
+				return []
+			
+			nodes = found
 		
-		expr = getRegEx(pattern)
+		return [node.address for node in nodes if node.address != None]
+	
+	def getOSCAddressSpace(self):
+		"""Returns a list containing all OSC-addresses registerd with this Server.
+		"""
+		return self._space.callbacks.keys()
+	
+	def _isHandled(self, pattern):
+		"""Returns True if dispatchMessage() would call any callback for the given OSC-address pattern
+		"""
+		space = self._space
+		return ('default' in space.callbacks) or (len(self._matchAddresses(pattern, space)) > 0)
+	
+	def dispatchMessage(self, pattern, tags, data, client_address, batches=None):
+		"""Attmept to match the given OSC-address pattern, which may contain '*',
+		against all callbacks registered with the OSCServer. (see OSCAddressSpace)
+		Calls the matching callback and returns whatever it returns.
+		If no match is found, and a 'default' callback is registered, it calls that one,
+		or raises NoCallbackError if a 'default' callback is not registered.
 		
+		  - pattern (string):  The OSC-address of the receied message
+		  - tags (string):  The OSC-typetags of the receied message's arguments, without ','
+		  - data (list):  The message arguments. Runs of arguments decoded as arrays (see decodeOSC()'s 'array_runs')
+		  are passed to the callbacks as they are, but for typed callbacks (see addTypedMsgHandler()),
+		  which get every argument separately.
+		  - batches (dict):  If given, messages for batch-callbacks (see addBatchMsgHandler()) are added
+		  to the list of messages for their address in this dict, to be handled by _flushBatches() later.
+		  Otherwise, batch-callbacks are called right away, with a batch of one.
+		"""
+		args = data
+		if len(tags) != len(data):
+			# runs of arguments may have been decoded as arrays; each counts as its length
+			count = 0
+			for value in data:
+				if _isArray(value):
+					count += len(value)
+				else:
+					count += 1
+			
+			if len(tags) != count:
+				raise OSCServerError("Malformed OSC-message; got %d typetags [%s] vs. %d values" % (len(tags), tags, count))
+			
+			args = None
+		
+		space = self._space
 		replies = []
 		matched = 0
-		for addr in self.callbacks.keys():
-			match = expr.match(addr)
-			if match and (match.end() == len(addr)):
-				reply = self.callbacks[addr](pattern, tags, data, client_address)
+		for addr in self._matchAddresses(pattern, space):
+			callback = space.callbacks[addr]
+			if addr in space.batched:
 				matched += 1
-				if isinstance(reply, OSCMessage):
-					replies.append(reply)
-				elif reply != None:
-					raise TypeError("Message-callback %s did not return OSCMessage or None: %s" % (self.server.callbacks[addr], type(reply)))
-					
+				if batches != None:
+					batches.setdefault(addr, []).append((pattern, tags, data, client_address))
+				else:
+					callback(addr, [(pattern, tags, data, client_address)])
+				continue
+			
+			if addr in space.typed:
+				if tags != space.typed[addr][0]:
+					continue
+				
+				if args == None:
+					args = _expandArrays(data)
+				
+				reply = callback(pattern, client_address, *args)
+			else:
+				reply = callback(pattern, tags, data, client_address)
+			
+			matched += 1
+			self._addReply(replies, callback, reply)
+		
 		if matched == 0:
-			if 'default' in self.callbacks:
-				reply = self.callbacks['default'](pattern, tags, data, client_address)
-				if isinstance(reply, OSCMessage):
-					replies.append(reply)
-				elif reply != None:
-					raise TypeError("Message-callback %s did not return OSCMessage or None: %s" % (self.server.callbacks['default'], type(reply)))
+			if 'default' in space.callbacks:
+				reply = space.callbacks['default'](pattern, tags, data, client_address)
+				self._addReply(replies, space.callbacks['default'], reply)
 			else:
 				raise NoCallbackError(pattern)
 		
 		return replies
+	
+	def _flushBatches(self, batches):
+		"""Calls the batch-callbacks (see addBatchMsgHandler()) with the messages collected for them in 'batches',
+		a dict of lists of messages per address (see dispatchMessage()), and empties it.
+		"""
+		space = self._space
+		for (addr, batch) in batches.items():
+			del batches[addr]
+			if addr in space.batched:
+				space.callbacks[addr](addr, batch)
+	
+	def _addReply(self, replies, callback, reply):
+		"""Appends the reply returned by a message-callback, if any, to the list of 'replies'
+		"""
+		if isinstance(reply, OSCMessage):
+			replies.append(reply)
+		elif reply != None:
+			raise TypeError("Message-callback %s did not return OSCMessage or None: %s" % (callback, type(reply)))
+	
+	def _dispatchTyped(self, message, client_address, blob_views=False):
+		"""Dispatch a _LazyMessage sent straight to an address registered with addTypedMsgHandler(),
+		checking its typetags & decoding its arguments for the typed callback in one go.
+		Returns the list of replies, or None if there's no typed callback for the address, or if the message's
+		typetags don't match (or it's truncated); it then needs to be decoded & dispatched as usual.
+		"""
+		space = self._space
+		if message.address not in space.typed:
+			return None
+		
+		(typetags, binary, decoder) = space.typed[message.address]
+		data = message.data
+		offset = message.offset
+		if data[offset:offset + len(binary)] != binary:
+			return None
+		
+		if blob_views and ('b' in typetags):
+			blobs = memoryview(buffer(data))
+		else:
+			blobs = None
+		
+		args = decoder(data, offset + len(binary), message.end, blobs)
+		if args == None:
+			return None
+		
+		replies = []
+		callback = space.callbacks[message.address]
+		self._addReply(replies, callback, callback(message.address, client_address, *args))
+		return replies
+
+######
+#
+# OSCScheduler class
+#
+######
+
+class OSCScheduler(object):
+	"""Calls callbacks at the time given by an OSC-timetag, so receiving doesn't have to wait for
+	future-dated OSC-bundles.
+	The pending callbacks are kept in a heap ordered by timetag, and a single timer-thread
+	(started when the first callback is scheduled) waits for the earliest one and calls it.
+	Callbacks are called from that thread, one after another.
+	
+	Bundles that arrive after their timetag are handled according to the 'late_policy':
+	  - 'run': handle them right away, as if they were on time
+	  - 'drop': drop them, and count them in stats['dropped']
+	  - 'count': handle them right away, and count them in stats['late']
+	Timetags less than 'tolerance' seconds in the past don't count as late.
+	
+	The scheduler keeps these counters in its 'stats' dict:
+	  - 'scheduled': callbacks queued for later
+	  - 'run': queued callbacks called
+	  - 'late': late bundles handled (with the 'count' policy)
+	  - 'dropped': late bundles dropped (with the 'drop' policy), or queued callbacks discarded by close()
+	getJitter() reports how far after their timetags the queued callbacks were actually called.
+	
+	A non-threaded scheduler (see __init__()) doesn't queue anything, but blocks the caller until
+	the timetag is due (like a ForkingOSCServer's child-processes have to).
+	A polled scheduler queues callbacks without a timer-thread; an event-loop calls runDue() instead
+	(see asyncLoop() and OSCServer.handle_request()).
+	"""
+	late_policies = ('run', 'drop', 'count')
+	
+	# how long close() waits for the timer-thread to finish
+	timeout = 1.0
+	
+	def __init__(self, late_policy='run', tolerance=0., threaded=True, polled=False):
+		"""Instantiate an OSCScheduler.
+		  - late_policy (string): what to do with late bundles; 'run', 'drop' or 'count' (see above)
+		  - tolerance (float): how many seconds after its timetag a bundle still isn't late
+		  - threaded (bool): queue future callbacks for the timer-thread? Otherwise schedule() waits
+		  for the timetag itself.
+		  - polled (bool): queue future callbacks, but leave calling them to runDue()
+		  (instead of a timer-thread; this overrides 'threaded')
+		"""
+		self.setLatePolicy(late_policy)
+		self.tolerance = tolerance
+		self.threaded = threaded
+		self.polled = polled
+		
+		self._queue = []
+		self._sequence = itertools.count()
+		self._cond = threading.Condition()
+		self._thread = None
+		self._running = True
+		
+		self.stats = {'scheduled':0, 'run':0, 'late':0, 'dropped':0}
+		
+		# number, sum, sum of squares & maximum of the delays between timetags and actual calls
+		self._jitter = [0, 0., 0., 0.]
+	
+	def setLatePolicy(self, late_policy):
+		"""Set what to do with bundles that arrive after their timetag; 'run', 'drop' or 'count'
+		"""
+		if late_policy not in self.late_policies:
+			raise ValueError("late_policy must be one of %s, not %s" % (str(self.late_policies), repr(late_policy)))
+		
+		self.late_policy = late_policy
+	
+	def schedule(self, timetag, callback, *args):
+		"""Schedule callback(*args) to be called at 'timetag' (in floating seconds since the Epoch).
+		Returns True if the scheduler took care of the callback; it was queued for later,
+		or dropped because 'timetag' has passed already (see 'late_policy').
+		Returns False if 'timetag' is due, and the caller should call the callback (or just handle the bundle)
+		right away.
+		"""
+		now = time.time()
+		if timetag <= now:
+			return self._isDropped(now - timetag)
+		
+		if not (self.threaded or self.polled):
+			time.sleep(timetag - now)
+			self.stats['scheduled'] += 1
+			self.stats['run'] += 1
+			self._addJitter(time.time() - timetag)
+			return False
+		
+		self._cond.acquire()
+		try:
+			if not self._running:
+				self.stats['dropped'] += 1
+				return True
+			
+			sequence = self._sequence.next()
+			heapq.heappush(self._queue, (timetag, sequence, callback, args))
+			self.stats['scheduled'] += 1
+			
+			if self.polled:
+				pass
+			elif self._thread == None:
+				self._thread = threading.Thread(target=self._run, name="OSCScheduler")
+				self._thread.setDaemon(True)
+				self._thread.start()
+			elif self._queue[0][1] == sequence:
+				# the new callback is the earliest; wake the timer-thread to wait for this one instead
+				self._cond.notify()
+		finally:
+			self._cond.release()
+		
+		return True
+	
+	def _isDropped(self, lateness):
+		"""Apply the 'late_policy' to a bundle that's due 'lateness' seconds ago.
+		Returns True if the bundle is dropped, False if it should be handled right away.
+		"""
+		if (lateness <= self.tolerance) or (self.late_policy == 'run'):
+			return False
+		
+		if self.late_policy == 'drop':
+			self.stats['dropped'] += 1
+			return True
+		
+		self.stats['late'] += 1
+		return False
+	
+	def _run(self):
+		"""The timer-thread; waits for the earliest of the queued callbacks to become due, and calls it
+		"""
+		self._cond.acquire()
+		try:
+			while self._running:
+				if not len(self._queue):
+					self._cond.wait()
+					continue
+				
+				delay = self._queue[0][0] - time.time()
+				if delay > 0.:
+					self._cond.wait(delay)
+					continue
+				
+				(timetag, _, callback, args) = heapq.heappop(self._queue)
+				self._cond.release()
+				try:
+					self._call(timetag, callback, args)
+				finally:
+					self._cond.acquire()
+		finally:
+			self._cond.release()
+	
+	def runDue(self):
+		"""Call the queued callbacks that are due (for a polled scheduler, from an event-loop).
+		Returns the number of seconds until the next callback is due, or None if none are waiting.
+		"""
+		while True:
+			self._cond.acquire()
+			try:
+				if not len(self._queue):
+					return None
+				
+				delay = self._queue[0][0] - time.time()
+				if delay > 0.:
+					return delay
+				
+				(timetag, _, callback, args) = heapq.heappop(self._queue)
+			finally:
+				self._cond.release()
+			
+			self._call(timetag, callback, args)
+	
+	def _call(self, timetag, callback, args):
+		"""Call a queued callback that's due, counting it in the stats
+		"""
+		self.stats['run'] += 1
+		self._addJitter(time.time() - timetag)
+		try:
+			callback(*args)
+		except:
+			self.handle_error(callback)
+	
+	def _addJitter(self, delay):
+		"""Add the delay between a callback's timetag and the actual call to the jitter-statistics
+		"""
+		jitter = self._jitter
+		jitter[0] += 1
+		jitter[1] += delay
+		jitter[2] += delay * delay
+		if delay > jitter[3]:
+			jitter[3] = delay
+	
+	def getJitter(self):
+		"""Returns a dict of statistics on how many seconds after their timetag the scheduled callbacks
+		were actually called: 'count', 'mean', 'stddev' & 'max'
+		"""
+		(count, total, squares, maximum) = self._jitter
+		if count == 0:
+			return {'count':0, 'mean':0., 'stddev':0., 'max':0.}
+		
+		mean = total / count
+		variance = max((squares / count) - (mean * mean), 0.)
+		return {'count':count, 'mean':mean, 'stddev':math.sqrt(variance), 'max':maximum}
+	
+	def resetStats(self):
+		"""Reset the counters in 'stats' and the jitter-statistics
+		"""
+		for key in self.stats.keys():
+			self.stats[key] = 0
+		
+		self._jitter = [0, 0., 0., 0.]
+	
+	def pending(self):
+		"""Returns the number of callbacks waiting to be called
+		"""
+		return len(self._queue)
+	
+	def handle_error(self, callback):
+		"""Handle an exception in a scheduled callback.
+		Writes the error to sys.stderr
+		"""
+		(e_type, e) = sys.exc_info()[:2]
+		sys.stderr.write("OSCScheduler: %s in scheduled callback %s: %s\n" % (e_type.__name__, repr(callback), str(e)))
+	
+	def close(self):
+		"""Stop the timer-thread, discarding any callbacks still waiting.
+		Waits (up to 'timeout' seconds) for a callback that's being called right now to return
+		"""
+		self._cond.acquire()
+		try:
+			self._running = False
+			self.stats['dropped'] += len(self._queue)
+			self._queue = []
+			self._cond.notify()
+		finally:
+			self._cond.release()
+		
+		if (self._thread != None) and (self._thread != threading.currentThread()):
+			self._thread.join(self.timeout)
+
+######
+#
+# OSCWorkerPool class
+#
+######
+
+class OSCWorkerPool(object):
+	"""A fixed number of worker-threads, calling the callbacks submitted to a bounded work-queue.
+	
+	When the queue is full, submit() follows the 'overflow_policy':
+	  - 'block': wait until a worker takes the next callback from the queue.
+	  (a callback submitted from one of the pool's own worker-threads is called right away instead,
+	  so the workers can't all end up waiting for each other)
+	  - 'drop-oldest': discard the callback that has been waiting longest, to make room
+	  - 'drop-newest': discard the callback being submitted
+	
+	The pool keeps these counters in its 'stats' dict:
+	  - 'submitted': callbacks submitted
+	  - 'completed': callbacks called
+	  - 'dropped': callbacks discarded by the overflow-policy, or by close()
+	  - 'blocked': submit() calls that had to wait for room in the queue
+	  - 'max_depth': the longest the queue has been
+	depth() and busy() tell how many callbacks are waiting, and how many workers are busy, right now.
+	"""
+	overflow_policies = ('block', 'drop-oldest', 'drop-newest')
+	
+	# how long close() waits for each worker-thread to finish
+	timeout = 1.0
+	
+	def __init__(self, size=8, queue_size=1024, overflow_policy='block', name="OSCWorker"):
+		"""Instantiate an OSCWorkerPool, and start its worker-threads.
+		  - size (int): the number of worker-threads
+		  - queue_size (int): the max. number of callbacks waiting for a worker
+		  - overflow_policy (string): what submit() does when the queue is full; 'block', 'drop-oldest' or 'drop-newest'
+		  - name (string): the worker-threads' names are this, plus a number
+		"""
+		if size < 1:
+			raise ValueError("An OSCWorkerPool needs at least one worker-thread")
+		
+		if queue_size < 1:
+			raise ValueError("An OSCWorkerPool needs room for at least one callback in its queue")
+		
+		self.setOverflowPolicy(overflow_policy)
+		self.size = size
+		self.queue_size = queue_size
+		
+		self._queue = collections.deque()
+		self._lock = threading.Lock()
+		self._notEmpty = threading.Condition(self._lock)
+		self._notFull = threading.Condition(self._lock)
+		self._running = True
+		self._busy = 0
+		
+		self.stats = {'submitted':0, 'completed':0, 'dropped':0, 'blocked':0, 'max_depth':0}
+		
+		self._workers = set()
+		for i in range(size):
+			t = threading.Thread(target=self._work, name="%s-%d" % (name, i))
+			t.setDaemon(True)
+			self._workers.add(t)
+		
+		for t in self._workers:
+			t.start()
+	
+	def setOverflowPolicy(self, overflow_policy):
+		"""Set what submit() does when the queue is full; 'block', 'drop-oldest' or 'drop-newest'
+		"""
+		if overflow_policy not in self.overflow_policies:
+			raise ValueError("overflow_policy must be one of %s, not %s" % (str(self.overflow_policies), repr(overflow_policy)))
+		
+		self.overflow_policy = overflow_policy
+	
+	def submit(self, callback, args=(), dropped=None):
+		"""Queue callback(*args) to be called by the next free worker-thread.
+		If the callback is discarded (by the overflow-policy, or because the pool is closed),
+		'dropped' is called instead (without arguments), if given.
+		Returns False if this callback was discarded right away.
+		"""
+		discarded = None
+		inline = False
+		blocked = False
+		
+		self._lock.acquire()
+		try:
+			self.stats['submitted'] += 1
+			
+			while self._running and (len(self._queue) >= self.queue_size):
+				if self.overflow_policy == 'drop-newest':
+					break
+				
+				if self.overflow_policy == 'drop-oldest':
+					discarded = self._queue.popleft()[2]
+					self.stats['dropped'] += 1
+					continue
+				
+				if threading.currentThread() in self._workers:
+					inline = True
+					break
+				
+				if not blocked:
+					self.stats['blocked'] += 1
+					blocked = True
+				
+				self._notFull.wait()
+			
+			queued = self._running and (len(self._queue) < self.queue_size) and not inline
+			if queued:
+				self._queue.append((callback, args, dropped))
+				if len(self._queue) > self.stats['max_depth']:
+					self.stats['max_depth'] = len(self._queue)
+				
+				self._notEmpty.notify()
+			elif not inline:
+				self.stats['dropped'] += 1
+		finally:
+			self._lock.release()
+		
+		if discarded != None:
+			discarded()
+		
+		if inline:
+			self._call(callback, args)
+			self.stats['completed'] += 1
+			return True
+		
+		if (not queued) and (dropped != None):
+			dropped()
+		
+		return queued
+	
+	def _work(self):
+		"""A worker-thread; takes the next callback from the queue and calls it
+		"""
+		while True:
+			self._lock.acquire()
+			try:
+				while self._running and not len(self._queue):
+					self._notEmpty.wait()
+				
+				if not self._running:
+					return
+				
+				(callback, args, _) = self._queue.popleft()
+				self._busy += 1
+				self._notFull.notify()
+			finally:
+				self._lock.release()
+			
+			self._call(callback, args)
+			
+			self._lock.acquire()
+			try:
+				self._busy -= 1
+				self.stats['completed'] += 1
+			finally:
+				self._lock.release()
+	
+	def _call(self, callback, args):
+		"""Call one callback, handling any exception
+		"""
+		try:
+			callback(*args)
+		except:
+			self.handle_error(callback)
+	
+	def handle_error(self, callback):
+		"""Handle an exception in a submitted callback.
+		Writes the error to sys.stderr
+		"""
+		(e_type, e) = sys.exc_info()[:2]
+		sys.stderr.write("OSCWorkerPool: %s in callback %s: %s\n" % (e_type.__name__, repr(callback), str(e)))
+	
+	def depth(self):
+		"""Returns the number of callbacks waiting for a worker
+		"""
+		return len(self._queue)
+	
+	def busy(self):
+		"""Returns the number of worker-threads calling a callback right now
+		"""
+		return self._busy
+	
+	def resetStats(self):
+		"""Reset the counters in 'stats'
+		"""
+		for key in self.stats.keys():
+			self.stats[key] = 0
+	
+	def close(self):
+		"""Stop the worker-threads, discarding any callbacks still waiting.
+		Waits (up to 'timeout' seconds per worker) for the callbacks being called right now to return
+		"""
+		self._lock.acquire()
+		try:
+			self._running = False
+			discarded = [item[2] for item in self._queue]
+			self.stats['dropped'] += len(discarded)
+			self._queue.clear()
+			self._notEmpty.notifyAll()
+			self._notFull.notifyAll()
+		finally:
+			self._lock.release()
+		
+		for dropped in discarded:
+			if dropped != None:
+				dropped()
+		
+		for t in self._workers:
+			if t != threading.currentThread():
+				t.join(self.timeout)
 
 ######
 #
@@ -1768,17 +3891,44 @@ class OSCRequestHandler(DatagramRequestHandler):
 		"""
 		(self.packet, self.socket) = self.request
 		self.replies = []
+		
+		# collect messages for batch-callbacks along with the server (during a burst), or else per request
+		self.batches = self.server._batches
+		if self.batches == None:
+			self.batches = {}
 
+	def _dispatch(self, decoded):
+		"""Dispatch a single OSC-message to the server.
+		If only the message's address has been decoded (see OSCServer.lazy_decoding), its arguments
+		are decoded now, unless no callback would handle it; then it's only counted as 'dropped'.
+		Messages sent straight to a typed handler's address (see addTypedMsgHandler()) are decoded for it in one go.
+		"""
+		self.server._addStat('messages')
+		if isinstance(decoded, _LazyMessage):
+			replies = self.server._dispatchTyped(decoded, self.client_address, self.server.blob_views)
+			if replies != None:
+				self.replies += replies
+				return
+			
+			if self.server.lazy_decoding and not self.server._isHandled(decoded.address):
+				self.server._addStat('dropped')
+				return
+			
+			decoded = decoded.decode(self.server.blob_views, self.server.array_runs)
+		
+		self.replies += self.server.dispatchMessage(decoded[0], decoded[1][1:], decoded[2:], self.client_address, self.batches)
+	
 	def _unbundle(self, decoded):
-		"""Recursive bundle-unpacking function"""
-		if decoded[0] != "#bundle":
-			self.replies += self.server.dispatchMessage(decoded[0], decoded[1][1:], decoded[2:], self.client_address)
+		"""Recursive bundle-unpacking function.
+		Bundles with a future timetag are left to the server's scheduler (see OSCScheduler)
+		"""
+		if isinstance(decoded, _LazyMessage) or (decoded[0] != "#bundle"):
+			self._dispatch(decoded)
 			return
 		
-		now = time.time()
 		timetag = decoded[1]
-		if (timetag > 0.) and (timetag > now):
-			time.sleep(timetag - now)
+		if (timetag > 0.) and self.server.scheduler.schedule(timetag, self.server._runBundle, decoded, self.client_address):
+			return
 		
 		for msg in decoded[2:]:
 			self._unbundle(msg)
@@ -1786,17 +3936,26 @@ class OSCRequestHandler(DatagramRequestHandler):
 	def handle(self):
 		"""Handle incoming OSCMessage
 		"""
-		decoded = decodeOSC(self.packet)
-		if not len(decoded):
+		if self.server.lazy_decoding or len(self.server._space.typed):
+			decoded = _scanOSC(self.packet, 0, len(self.packet))
+		else:
+			decoded = decodeOSC(self.packet, self.server.blob_views, self.server.array_runs)
+		
+		if decoded == []:
 			return
 		
+		self.server._addStat('packets')
 		self._unbundle(decoded)
 		
 	def finish(self):
 		"""Finish handling OSCMessage.
+		Call the batch-callbacks for the messages collected in this request (unless the server does that)
 		Send any reply returned by the callback(s) back to the originating client
 		as an OSCMessage or OSCBundle
 		"""
+		if self.batches != self.server._batches:
+			self.server._flushBatches(self.batches)
+		
 		if self.server.return_port:
 			self.client_address = (self.client_address[0], self.server.return_port)
 		
@@ -1819,17 +3978,16 @@ class ThreadingOSCRequestHandler(OSCRequestHandler):
 		"""Recursive bundle-unpacking function
 		This version starts a new thread for each sub-Bundle found in the Bundle,
 		then waits for all its children to finish.
+		Bundles with a future timetag are left to the server's scheduler (see OSCScheduler)
 		"""
-		if decoded[0] != "#bundle":
-			self.replies += self.server.dispatchMessage(decoded[0], decoded[1][1:], decoded[2:], self.client_address)
+		if isinstance(decoded, _LazyMessage) or (decoded[0] != "#bundle"):
+			self._dispatch(decoded)
 			return
 		
-		now = time.time()
 		timetag = decoded[1]
-		if (timetag > 0.) and (timetag > now):
-			time.sleep(timetag - now)
-			now = time.time()
-			
+		if (timetag > 0.) and self.server.scheduler.schedule(timetag, self.server._runBundle, decoded, self.client_address):
+			return
+		
 		children = []
 		
 		for msg in decoded[2:]:
@@ -1841,6 +3999,243 @@ class ThreadingOSCRequestHandler(OSCRequestHandler):
 		for t in children:
 			t.join()
 		
+class PooledOSCRequestHandler(OSCRequestHandler):
+	"""OSCRequestHandler for the PooledOSCServer;
+	Submits each element of a bundle to the server's worker-pool, instead of starting a thread for it.
+	The request is finished (its replies sent, its batch-callbacks called) when its last element has been handled.
+	"""
+	def setup(self):
+		"""Prepare RequestHandler.
+		Counts this request as the first of the elements still being handled
+		"""
+		OSCRequestHandler.setup(self)
+		self._pending = 1
+		self._pendingLock = threading.Lock()
+	
+	def _unbundle(self, decoded):
+		"""Recursive bundle-unpacking function
+		This version submits each element of a bundle to the server's worker-pool.
+		Bundles with a future timetag are left to the server's scheduler (see OSCScheduler)
+		"""
+		if isinstance(decoded, _LazyMessage) or (decoded[0] != "#bundle"):
+			self._dispatch(decoded)
+			return
+		
+		timetag = decoded[1]
+		if (timetag > 0.) and self.server.scheduler.schedule(timetag, self.server._runBundle, decoded, self.client_address):
+			return
+		
+		for msg in decoded[2:]:
+			self._pendingLock.acquire()
+			self._pending += 1
+			self._pendingLock.release()
+			
+			self.server.pool.submit(self._handleElement, (msg,), self._elementDone)
+	
+	def _handleElement(self, decoded):
+		"""Handle one element of a bundle, in one of the server's worker-threads
+		"""
+		try:
+			self._unbundle(decoded)
+		except:
+			self.server.handle_error(self.request, self.client_address)
+		
+		self._elementDone()
+	
+	def _elementDone(self):
+		"""Count down the elements still being handled; the last one finishes the request
+		"""
+		self._pendingLock.acquire()
+		try:
+			self._pending -= 1
+			last = (self._pending == 0)
+		finally:
+			self._pendingLock.release()
+		
+		if last:
+			OSCRequestHandler.finish(self)
+	
+	def finish(self):
+		"""Finish handling OSCMessage, once all elements of the received bundle have been handled
+		"""
+		self._elementDone()
+
+class _DrainRequestHandler(OSCRequestHandler):
+	"""An OSCRequestHandler that's created by the server itself, and then handles one datagram after another
+	(see OSCServer.drain_socket), or the contents of a bundle scheduled for later (see OSCServer._runBundle())
+	"""
+	def __init__(self, server):
+		self.server = server
+	
+	def handlePacket(self, packet, client_address, length=None):
+		"""Handle one datagram, as a new OSCRequestHandler would.
+		The datagram is the first 'length' bytes of 'packet' (default: all of it), which may be a receive-buffer
+		"""
+		self.request = (packet, self.server.socket)
+		self.client_address = client_address
+		if length == None:
+			self.length = len(packet)
+		else:
+			self.length = length
+		
+		self.setup()
+		try:
+			self.handle()
+		finally:
+			self.finish()
+	
+	def handle(self):
+		"""Handle the datagram, decoding it straight from the receive-buffer.
+		Bundles are decoded from a copy, since (some of) their contents may be scheduled for later,
+		when the buffer holds another datagram
+		"""
+		server = self.server
+		packet = self.packet
+		end = self.length
+		if packet.startswith("#bundle\0", 0, end):
+			packet = str(buffer(packet, 0, end))
+		
+		if server.lazy_decoding or len(server._space.typed):
+			decoded = _scanOSC(packet, 0, end)
+		else:
+			if server.blob_views:
+				blobs = memoryview(buffer(packet))
+			else:
+				blobs = None
+			
+			decoded = _decodeOSC(packet, 0, end, blobs, server.array_runs)
+		
+		if decoded == []:
+			return
+		
+		server._addStat('packets')
+		self._unbundle(decoded)
+	
+	def handleBundle(self, decoded, client_address):
+		"""Handle the contents of a (decoded) bundle, as a new OSCRequestHandler would
+		"""
+		self.request = (None, self.server.socket)
+		self.client_address = client_address
+		self.setup()
+		
+		# this runs outside of the server's bursts; call the batch-callbacks right after this bundle
+		self.batches = {}
+		try:
+			for msg in decoded[2:]:
+				self._unbundle(msg)
+		finally:
+			self.finish()
+
+class _RecvMMsg(object):
+	"""Reads the datagrams waiting on a socket with a single call to Linux' recvmmsg() (through ctypes),
+	into 'count' buffers of 'size' bytes that are allocated once.
+	An instance should only ever read from one socket (or from sockets of the same address-family).
+	Raises OSError if recvmmsg() is not available.
+	"""
+	# the size of a 'struct sockaddr_storage'
+	name_size = 128
+	
+	def __init__(self, count, size):
+		if _ctypes == None:
+			raise OSError("recvmmsg() is not available without ctypes")
+		
+		libc = _ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+		if not hasattr(libc, 'recvmmsg'):
+			raise OSError("recvmmsg() is not available")
+		
+		class iovec(_ctypes.Structure):
+			_fields_ = [('iov_base', _ctypes.c_void_p), ('iov_len', _ctypes.c_size_t)]
+		
+		class msghdr(_ctypes.Structure):
+			_fields_ = [('msg_name', _ctypes.c_void_p), ('msg_namelen', _ctypes.c_uint32),
+					('msg_iov', _ctypes.POINTER(iovec)), ('msg_iovlen', _ctypes.c_size_t),
+					('msg_control', _ctypes.c_void_p), ('msg_controllen', _ctypes.c_size_t),
+					('msg_flags', _ctypes.c_int)]
+		
+		class mmsghdr(_ctypes.Structure):
+			_fields_ = [('msg_hdr', msghdr), ('msg_len', _ctypes.c_uint)]
+		
+		self._recvmmsg = libc.recvmmsg
+		self._recvmmsg.argtypes = [_ctypes.c_int, _ctypes.POINTER(mmsghdr), _ctypes.c_uint, _ctypes.c_int, _ctypes.c_void_p]
+		self._recvmmsg.restype = _ctypes.c_int
+		
+		self.count = count
+		self.size = size
+		
+		# a bytearray per packet (which receive() returns, to be decoded in place),
+		# and one block of memory each for the source-addresses and the message-headers
+		self.buffers = [bytearray(size) for i in range(count)]
+		self._bufferViews = [(_ctypes.c_char * size).from_buffer(buf) for buf in self.buffers]
+		self._names = _ctypes.create_string_buffer(count * self.name_size)
+		self._iovecs = (iovec * count)()
+		self._msgs = (mmsghdr * count)()
+		
+		namebase = _ctypes.addressof(self._names)
+		for i in range(count):
+			self._iovecs[i].iov_base = _ctypes.addressof(self._bufferViews[i])
+			self._iovecs[i].iov_len = size
+			hdr = self._msgs[i].msg_hdr
+			hdr.msg_name = namebase + (i * self.name_size)
+			# the kernel overwrites this with the size of the socket's address-family's sockaddr,
+			# which then stays large enough for all following calls
+			hdr.msg_namelen = self.name_size
+			hdr.msg_iov = _ctypes.pointer(self._iovecs[i])
+			hdr.msg_iovlen = 1
+		
+		# where to find the lengths in the message-headers, read back in one go by receive()
+		self._msgSize = _ctypes.sizeof(mmsghdr)
+		self._nameLenOffset = msghdr.msg_namelen.offset
+		self._lenOffset = mmsghdr.msg_len.offset
+		self._uint = struct.Struct("=I")
+		
+		# (host, port) tuples per binary source-address recently seen
+		self._addresses = LRUCache(256)
+	
+	def receive(self, sock):
+		"""Returns a list of (buffer, nbytes, client_address) tuples of the datagrams waiting on socket 'sock',
+		up to 'count' of them, without blocking. Each datagram is the first 'nbytes' of a bytearray 'buffer',
+		which the next call overwrites.
+		"""
+		n = self._recvmmsg(sock.fileno(), self._msgs, self.count, 0x40, None)	# 0x40 = MSG_DONTWAIT
+		if n < 0:
+			err = _ctypes.get_errno()
+			if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+				return []
+			
+			raise socket.error(err, errno.errorcode.get(err, str(err)))
+		
+		headers = _ctypes.string_at(self._msgs, n * self._msgSize)
+		namebase = _ctypes.addressof(self._names)
+		unpack = self._uint.unpack_from
+		
+		received = []
+		for i in range(n):
+			offset = i * self._msgSize
+			(namelen,) = unpack(headers, offset + self._nameLenOffset)
+			(length,) = unpack(headers, offset + self._lenOffset)
+			
+			name = _ctypes.string_at(namebase + (i * self.name_size), namelen)
+			client_address = self._addresses.get(name)
+			if client_address == None:
+				client_address = self._parseAddress(name)
+				self._addresses[name] = client_address
+			
+			received.append((self.buffers[i], length, client_address))
+		
+		return received
+	
+	def _parseAddress(self, name):
+		"""Converts a binary 'struct sockaddr_in' or 'sockaddr_in6' to a (host, port) or (host, port, flowinfo, scopeid) tuple
+		"""
+		family = struct.unpack("=H", name[:2])[0]
+		port = struct.unpack(">H", name[2:4])[0]
+		if family == socket.AF_INET:
+			return (socket.inet_ntoa(name[4:8]), port)
+		
+		(flowinfo,) = struct.unpack(">I", name[4:8])
+		(scopeid,) = struct.unpack("=I", name[24:28])
+		return (socket.inet_ntop(socket.AF_INET6, name[8:24]), port, flowinfo, scopeid)
+
 ######
 #
 # OSCServer classes
@@ -1864,6 +4259,27 @@ class OSCServer(UDPServer, OSCAddressSpace):
 	# DEBUG: print error-tracebacks (to stderr)?
 	print_tracebacks = False
 	
+	# decode only the OSC-address of incoming messages first, and their arguments only if a callback
+	# (or the 'default' callback) matches? Unhandled messages are then counted in stats['dropped'],
+	# instead of raising NoCallbackError.
+	lazy_decoding = False
+	
+	# the max. number of datagrams read (and handled) in one burst by handle_request()
+	max_burst = 64
+	
+	# read all datagrams waiting on the socket into buffers allocated once, and handle them one after another
+	# without creating an OSCRequestHandler for each? (not for a Threading- or ForkingOSCServer)
+	# A subclass' RequestHandlerClass is not used then, and verify_request() gets (buffer, socket, nbytes) requests.
+	# Messages are decoded straight from the buffers, which are reused for the next burst;
+	# see decodeOSC() for how long blob-views (and arrays) into them stay valid.
+	drain_socket = False
+	
+	# with 'drain_socket', read them with a single call to Linux' recvmmsg(), if available?
+	use_recvmmsg = False
+	
+	# let other sockets bind the same host & port (with SO_REUSEPORT)? (see PreforkedOSCServer)
+	reuse_port = False
+	
 	def __init__(self, server_address, client=None, return_port=0):
 		"""Instantiate an OSCServer.
 		  - server_address ((host, port) tuple): the local host & UDP-port
@@ -1885,11 +4301,53 @@ class OSCServer(UDPServer, OSCAddressSpace):
 		self.running = False
 		self.client = None
 		
+		# counters of the OSC-packets & -messages received, of the messages dropped unhandled (see 'lazy_decoding')
+		# and of the messages to state-addresses dropped for newer ones (see addStateAddress()).
+		# These aren't all updated by a ForkingOSCServer; its requests are handled in child-processes
+		self.stats = {'packets':0, 'messages':0, 'dropped':0, 'coalesced':0}
+		self._statsLock = threading.Lock()
+		
+		# the OSC-addresses & -patterns marked as 'state', and whether recently received addresses match any of them
+		self._stateAddresses = set()
+		self._statePatterns = {}
+		self._stateCache = LRUCache(256)
+		
+		# the messages for batch-callbacks collected during a burst (see handle_request())
+		self._batches = None
+		
+		# the receive-buffers & request-handler reused with 'drain_socket'
+		self._recvBuffers = None
+		self._recvMMsg = None
+		self._drainHandler = None
+		
+		# requests are handled one at a time, by the thread calling handle_request()?
+		self._synchronous = not isinstance(self, (ThreadingMixIn, ForkingMixIn, PooledOSCServer))
+		
+		# calls the callbacks of bundles with a future timetag, when they are due.
+		# A synchronous server polls it from handle_request(), so bundles are handled by the same thread
+		# as other requests; a ForkingOSCServer's child-processes just wait for them.
+		if self._synchronous:
+			self.scheduler = OSCScheduler(polled=True)
+		else:
+			self.scheduler = OSCScheduler(threaded=not isinstance(self, ForkingMixIn))
+		
 		if client == None:
 			self.client = OSCClient(server=self)
 		else:
 			self.setClient(client)
 			
+	def server_bind(self):
+		"""Bind the socket to the server's address.
+		With 'reuse_port', other sockets may bind the same address (see PreforkedOSCServer)
+		"""
+		if self.reuse_port:
+			if _SO_REUSEPORT == None:
+				raise OSCServerError("SO_REUSEPORT is not available on this platform")
+			
+			self.socket.setsockopt(socket.SOL_SOCKET, _SO_REUSEPORT, 1)
+		
+		UDPServer.server_bind(self)
+	
 	def setClient(self, client):
 		"""Associate this Server with a new local Client instance, closing the Client this Server is currently using.
 		"""
@@ -1918,10 +4376,247 @@ class OSCServer(UDPServer, OSCAddressSpace):
 		while self.running:
 			self.handle_request()	# this times-out when no data arrives.
 
+	def handle_request(self):
+		"""Handle the requests received in one burst, possibly blocking until the first one arrives.
+		Like SocketServer's handle_request(), this respects self.timeout (and the socket's timeout)
+		and calls handle_timeout() if no request arrives in time.
+		All datagrams waiting when the first one is read, up to 'max_burst', are read before any are handled,
+		so the messages to state-addresses can be coalesced (see addStateAddress())
+		A synchronous server also calls the callbacks of scheduled bundles that are due,
+		and waits no longer than until the next one is.
+		"""
+		timeout = self.socket.gettimeout()
+		if timeout == None:
+			timeout = self.timeout
+		elif self.timeout != None:
+			timeout = min(timeout, self.timeout)
+		
+		synchronous = self._synchronous
+		due = None
+		if synchronous:
+			due = self.scheduler.runDue()
+			if (due != None) and ((timeout == None) or (due < timeout)):
+				timeout = due
+			else:
+				due = None
+		
+		while True:
+			try:
+				fd_sets = select.select([self], [], [], timeout)
+				break
+			except select.error, e:
+				if e[0] != errno.EINTR:
+					raise
+		
+		if not fd_sets[0]:
+			if due != None:
+				# woke up for the next scheduled bundle, not a timeout
+				self.scheduler.runDue()
+			else:
+				self.handle_timeout()
+			return
+		
+		drain = self.drain_socket and synchronous
+		if drain:
+			requests = self._drainSocket()
+		else:
+			requests = self._receiveBurst()
+		
+		if len(self._stateAddresses) or len(self._statePatterns):
+			requests = self._coalesce(requests)
+		
+		if len(self._space.batched) and synchronous:
+			# requests are handled right here; collect the messages for batch-callbacks over the whole burst
+			self._batches = {}
+		
+		try:
+			if drain:
+				if self._drainHandler == None:
+					self._drainHandler = _DrainRequestHandler(self)
+				
+				for (request, client_address) in requests:
+					if not self.verify_request(request, client_address):
+						continue
+					
+					try:
+						self._drainHandler.handlePacket(request[0], client_address, request[2])
+					except:
+						self.handle_error(request, client_address)
+			else:
+				for (request, client_address) in requests:
+					if self.verify_request(request, client_address):
+						try:
+							self.process_request(request, client_address)
+						except:
+							self.handle_error(request, client_address)
+							self.shutdown_request(request)
+					else:
+						self.shutdown_request(request)
+		finally:
+			batches = self._batches
+			self._batches = None
+		
+		if (batches != None) and len(batches):
+			try:
+				self._flushBatches(batches)
+			except:
+				# the batches hold messages from the whole (non-empty) burst; report to the client of the last one
+				self.handle_error(None, requests[-1][1])
+		
+		if synchronous:
+			self.scheduler.runDue()
+	
+	def _addStat(self, key, count=1):
+		"""Adds 'count' to stats[key]. Unless the server is synchronous, requests are handled by many threads
+		at once, so this takes a lock
+		"""
+		if self._synchronous:
+			self.stats[key] += count
+			return
+		
+		self._statsLock.acquire()
+		try:
+			self.stats[key] += count
+		finally:
+			self._statsLock.release()
+	
+	def _receiveBurst(self):
+		"""Reads the datagrams waiting on the socket, up to 'max_burst' of them, without blocking
+		(but for the first one, which select() said is there).
+		Returns a list of (request, client_address) tuples, as returned by get_request()
+		"""
+		requests = []
+		while len(requests) < self.max_burst:
+			try:
+				requests.append(self.get_request())
+			except socket.error:
+				break
+			
+			if not select.select([self], [], [], 0)[0]:
+				break
+		
+		return requests
+	
+	def _drainSocket(self):
+		"""Reads the datagrams waiting on the socket, up to 'max_burst' of them, without blocking,
+		into receive-buffers that are allocated once (see 'drain_socket' & 'use_recvmmsg').
+		Returns a list of (request, client_address) tuples, like _receiveBurst(), but each request
+		is a (buffer, socket, nbytes) tuple; the datagram is the first 'nbytes' of the bytearray 'buffer'.
+		"""
+		if self.use_recvmmsg:
+			if (self._recvMMsg == None) or (self._recvMMsg and (self._recvMMsg.count != self.max_burst)):
+				try:
+					self._recvMMsg = _RecvMMsg(self.max_burst, self.max_packet_size)
+				except (OSError, AttributeError):
+					self._recvMMsg = False
+			
+			if self._recvMMsg:
+				return [((buf, self.socket, nbytes), client_address) for (buf, nbytes, client_address) in self._recvMMsg.receive(self.socket)]
+		
+		if (self._recvBuffers == None) or (len(self._recvBuffers) != self.max_burst):
+			self._recvBuffers = [bytearray(self.max_packet_size) for i in range(self.max_burst)]
+		
+		requests = []
+		timeout = self.socket.gettimeout()
+		self.socket.setblocking(0)
+		try:
+			for buf in self._recvBuffers:
+				try:
+					(nbytes, client_address) = self.socket.recvfrom_into(buf)
+				except socket.error:
+					break
+				
+				requests.append(((buf, self.socket, nbytes), client_address))
+		finally:
+			self.socket.settimeout(timeout)
+		
+		return requests
+	
+	def addStateAddress(self, address):
+		"""Mark an OSC-address (or address-pattern, matching any number of addresses) as carrying 'state',
+		for which only the latest value matters (a fader-position, or a sensor-reading).
+		Of the (un-bundled) messages to a state-address received in one burst (see handle_request()),
+		only the newest one is dispatched. The older ones are dropped, and counted in stats['coalesced'].
+		"""
+		address = '/' + address.strip('/')
+		if _wildcardChars.search(address):
+			self._statePatterns[address] = getPattern(address)
+		else:
+			self._stateAddresses.add(address)
+		
+		self._stateCache.clear()
+	
+	def delStateAddress(self, address):
+		"""Unmark an OSC-address (or address-pattern) marked as carrying 'state' (see addStateAddress())
+		"""
+		address = '/' + address.strip('/')
+		self._stateAddresses.discard(address)
+		self._statePatterns.pop(address, None)
+		self._stateCache.clear()
+	
+	def _isStateAddress(self, address):
+		"""Returns True if the given OSC-address is marked as carrying 'state', or matches a pattern that is
+		"""
+		if address in self._stateAddresses:
+			return True
+		
+		if not len(self._statePatterns):
+			return False
+		
+		state = self._stateCache.get(address)
+		if state == None:
+			state = False
+			for pattern in self._statePatterns.values():
+				if pattern.match(address):
+					state = True
+					break
+			
+			self._stateCache[address] = state
+		
+		return state
+	
+	def _coalesce(self, requests):
+		"""Drops all but the newest of the messages to each state-address from the given list of
+		(request, client_address) tuples. Bundles are left alone.
+		Returns the list of requests left.
+		"""
+		latest = {}
+		kept = []
+		for (request, client_address) in requests:
+			packet = request[0]
+			if len(request) > 2:
+				# a receive-buffer (see _drainSocket())
+				end = request[2]
+			else:
+				end = len(packet)
+			
+			(address, _) = _readStringAt(packet, 0, end)
+			if self._isStateAddress(address):
+				if address in latest:
+					kept[latest[address]] = None
+					self._addStat('coalesced')
+				
+				latest[address] = len(kept)
+			
+			kept.append((request, client_address))
+		
+		return [item for item in kept if item != None]
+	
+	def _runBundle(self, decoded, client_address):
+		"""Handle the contents of a bundle scheduled for later (called by the scheduler when the bundle is due),
+		and send any replies
+		"""
+		try:
+			_DrainRequestHandler(self).handleBundle(decoded, client_address)
+		except:
+			self.handle_error(None, client_address)
+	
 	def close(self):
-		"""Stops serving requests, closes server (socket), closes used client
+		"""Stops serving requests, closes server (socket), closes used client,
+		discards any bundles still waiting for their timetag
 		"""
 		self.running = False
+		self.scheduler.close()
 		self.client.close()
 		self.server_close()
 	
@@ -2348,6 +5043,304 @@ class ThreadingOSCServer(ThreadingMixIn, OSCServer):
 	# set the RequestHandlerClass, will be overridden by ForkingOSCServer & ThreadingOSCServer
 	RequestHandlerClass = ThreadingOSCRequestHandler
 
+class PooledOSCServer(OSCServer):
+	"""An Asynchronous OSCServer.
+	This server hands each incoming request to a fixed number of worker-threads, through a bounded
+	work-queue (see OSCWorkerPool). The elements of a bundle are submitted to the same pool.
+	The pool's size, queue-size & overflow-policy are taken from the class-attributes below;
+	the pool itself (with its stats) is the server's 'pool' attribute.
+	Requests discarded by the pool are counted in the server's stats['dropped_requests'].
+	"""
+	RequestHandlerClass = PooledOSCRequestHandler
+	
+	# the number of worker-threads
+	pool_size = 8
+	
+	# the max. number of requests & bundle-elements waiting for a worker
+	queue_size = 1024
+	
+	# what to do when the queue is full; 'block', 'drop-oldest' or 'drop-newest' (see OSCWorkerPool)
+	overflow_policy = 'block'
+	
+	def __init__(self, server_address, client=None, return_port=0):
+		"""Instantiate a PooledOSCServer, and start its worker-threads.
+		(see OSCServer.__init__() for the arguments)
+		"""
+		OSCServer.__init__(self, server_address, client, return_port)
+		self.pool = OSCWorkerPool(self.pool_size, self.queue_size, self.overflow_policy, "OSCServerWorker")
+		self.stats['dropped_requests'] = 0
+	
+	def process_request(self, request, client_address):
+		"""Submit the request to the worker-pool
+		"""
+		self.pool.submit(self._processRequest, (request, client_address), self._droppedRequest)
+	
+	def _droppedRequest(self):
+		"""Count a request discarded by the worker-pool's overflow-policy, or by its close()
+		"""
+		self._addStat('dropped_requests')
+	
+	def _processRequest(self, request, client_address):
+		"""Handle one request, in one of the worker-threads
+		"""
+		try:
+			self.finish_request(request, client_address)
+			self.shutdown_request(request)
+		except:
+			self.handle_error(request, client_address)
+			self.shutdown_request(request)
+	
+	def close(self):
+		"""Stops the worker-threads, then closes the server like OSCServer.close()
+		"""
+		self.pool.close()
+		OSCServer.close(self)
+
+class PreforkedOSCServer(OSCAddressSpace):
+	"""A multi-process OSC server.
+	A number of worker-processes are forked up front; each binds its own OSCServer to the same
+	UDP host & port with SO_REUSEPORT, and serves independently. The kernel spreads the incoming
+	datagrams over the workers' sockets by their source address & port (so many clients are
+	needed to keep all workers busy; the datagrams of a single client all end up at one worker).
+	
+	Message-handlers are registered with the PreforkedOSCServer itself, like with an OSCServer,
+	before the workers are started; each worker takes over this address-space as it is then.
+	A 'setup' function, if given, is called with each worker's OSCServer once it's created,
+	to register anything that needs the server itself (like addDefaultHandlers()).
+	
+	serve_forever() runs the supervisor; it restarts workers that exit or crash, and getStats()
+	adds up the workers' OSCServer.stats (which they publish in a block of shared memory).
+	Needs os.fork() and SO_REUSEPORT (Linux 3.9+, BSD).
+	"""
+	# the stats published by each worker (see OSCServer.stats)
+	stats_keys = ('packets', 'messages', 'dropped', 'coalesced')
+	
+	# how often (in seconds) the supervisor checks on its workers
+	check_interval = 0.5
+	
+	def __init__(self, server_address, workers=0, setup=None, server_class=None):
+		"""Instantiate a PreforkedOSCServer. The workers are started by start() or serve_forever()
+		  - server_address ((host, port) tuple): the local host & UDP-port the workers listen on.
+		  If port is 0, a free port is picked (see address())
+		  - workers (int): the number of worker-processes. 0 = one per CPU-core
+		  - setup (function): called with each worker's OSCServer, once it's created
+		  - server_class (class): the OSCServer class (or subclass) the workers use
+		"""
+		if not hasattr(os, 'fork'):
+			raise OSCServerError("PreforkedOSCServer needs os.fork(), which is not available on this platform")
+		
+		if _SO_REUSEPORT == None:
+			raise OSCServerError("PreforkedOSCServer needs SO_REUSEPORT, which is not available on this platform")
+		
+		OSCAddressSpace.__init__(self)
+		
+		if workers < 1:
+			try:
+				import multiprocessing
+				workers = multiprocessing.cpu_count()
+			except (ImportError, NotImplementedError):
+				workers = 1
+		
+		if server_class == None:
+			server_class = OSCServer
+		
+		self.workers = workers
+		self.setup = setup
+		self.server_class = server_class
+		self.server_address = self._reservePort(server_address)
+		
+		self.running = False
+		self.restarts = 0
+		self._pids = [None] * workers
+		self._supervisor = os.getpid()
+		
+		# each worker's stats, in shared memory, and the stats of the workers that have exited
+		self._statsStruct = struct.Struct("=%dQ" % len(self.stats_keys))
+		self._statsMap = mmap.mmap(-1, self._statsStruct.size * workers)
+		self._retired = dict([(key, 0) for key in self.stats_keys])
+	
+	def _reservePort(self, server_address):
+		"""Returns 'server_address' with a free port filled in, if its port is 0.
+		Each worker binding port 0 would end up on a port of its own, otherwise.
+		"""
+		(host, port) = server_address
+		if port != 0:
+			return server_address
+		
+		sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		try:
+			sock.setsockopt(socket.SOL_SOCKET, _SO_REUSEPORT, 1)
+			sock.bind(server_address)
+			return (host, sock.getsockname()[1])
+		finally:
+			sock.close()
+	
+	def address(self):
+		"""Returns a (host,port) tuple of the local address the workers listen on
+		"""
+		return self.server_address
+	
+	def start(self):
+		"""Fork the worker-processes
+		"""
+		self.running = True
+		for index in range(self.workers):
+			if self._pids[index] == None:
+				self._startWorker(index)
+	
+	def _startWorker(self, index):
+		"""Fork worker-process number 'index'
+		"""
+		pid = os.fork()
+		if pid:
+			self._pids[index] = pid
+			return
+		
+		# in the worker-process
+		status = 1
+		try:
+			try:
+				self._serveWorker(index)
+				status = 0
+			except KeyboardInterrupt:
+				status = 0
+			except:
+				(e_type, e) = sys.exc_info()[:2]
+				sys.stderr.write("PreforkedOSCServer worker %d: %s: %s\n" % (index, e_type.__name__, str(e)))
+		finally:
+			os._exit(status)
+	
+	def _serveWorker(self, index):
+		"""A worker-process' main loop; serves requests with an OSCServer of its own, publishing its stats
+		after each burst. Returns when the supervisor has exited.
+		"""
+		# the class-attribute is only changed in this (worker-)process
+		self.server_class.reuse_port = True
+		server = self.server_class(self.server_address)
+		
+		# take over the address-space registered with the supervisor (it's copy-on-write, see OSCAddressSpace)
+		server._space = self._space
+		if self.setup != None:
+			self.setup(server)
+		
+		offset = index * self._statsStruct.size
+		keys = self.stats_keys
+		stats = server.stats
+		while os.getppid() == self._supervisor:
+			server.handle_request()
+			self._statsStruct.pack_into(self._statsMap, offset, *[stats[key] for key in keys])
+	
+	def _reapWorkers(self):
+		"""Collect the exit-status of any workers that have exited, and restart them.
+		The stats of an exited worker are kept, and added to getStats()
+		Only the workers' pids are waited for, so other child-processes of the caller are left alone.
+		"""
+		for index in range(self.workers):
+			pid = self._pids[index]
+			if pid == None:
+				continue
+			
+			while True:
+				try:
+					(pid, status) = os.waitpid(pid, os.WNOHANG)
+				except OSError, e:
+					if e.errno == errno.EINTR:
+						continue
+					if e.errno != errno.ECHILD:
+						raise
+					# reaped by someone else already
+				break
+			
+			if not pid:
+				continue
+			
+			self._pids[index] = None
+			self._retireStats(index)
+			
+			if self.running:
+				self.restarts += 1
+				self._startWorker(index)
+	
+	def _retireStats(self, index):
+		"""Move the stats of worker 'index' to the stats of exited workers
+		"""
+		offset = index * self._statsStruct.size
+		values = self._statsStruct.unpack_from(self._statsMap, offset)
+		for (key, value) in zip(self.stats_keys, values):
+			self._retired[key] += value
+		
+		self._statsStruct.pack_into(self._statsMap, offset, *([0] * len(self.stats_keys)))
+	
+	def getWorkerStats(self):
+		"""Returns a list of (pid, stats) tuples; the stats published by each worker that's running right now
+		"""
+		out = []
+		for index in range(self.workers):
+			values = self._statsStruct.unpack_from(self._statsMap, index * self._statsStruct.size)
+			out.append((self._pids[index], dict(zip(self.stats_keys, values))))
+		
+		return out
+	
+	def getStats(self):
+		"""Returns the sum of all workers' stats (including those of workers that have exited),
+		plus the number of workers running ('workers') and the number of workers restarted ('restarts')
+		"""
+		totals = dict(self._retired)
+		for (pid, stats) in self.getWorkerStats():
+			for key in self.stats_keys:
+				totals[key] += stats[key]
+		
+		totals['workers'] = len([pid for pid in self._pids if pid != None])
+		totals['restarts'] = self.restarts
+		return totals
+	
+	def serve_forever(self):
+		"""Start the workers (if they aren't running yet), then supervise them until close() is called.
+		"""
+		self.start()
+		try:
+			while self.running:
+				time.sleep(self.check_interval)
+				self._reapWorkers()
+		except KeyboardInterrupt:
+			self.close()
+	
+	def close(self):
+		"""Stop the workers (with SIGTERM), and wait for them to exit
+		"""
+		self.running = False
+		for pid in self._pids:
+			if pid != None:
+				try:
+					os.kill(pid, signal.SIGTERM)
+				except OSError:
+					pass
+		
+		for index in range(self.workers):
+			pid = self._pids[index]
+			if pid == None:
+				continue
+			
+			while True:
+				try:
+					os.waitpid(pid, 0)
+				except OSError, e:
+					if e.errno == errno.EINTR:
+						continue
+				break
+			
+			self._pids[index] = None
+			self._retireStats(index)
+	
+	def __str__(self):
+		"""Returns a string containing this Server's Class-name, software-version, local bound address
+		and number of workers
+		"""
+		out = self.__class__.__name__
+		out += " v%s.%s-%s" % version
+		out += " listening on osc://%s with %d workers" % (getUrlStr(self.server_address), self.workers)
+		return out
+
 ######
 #
 # OSCError classes
@@ -2438,19 +5431,48 @@ class OSCStreamRequestHandler(StreamRequestHandler, OSCAddressSpace):
 		OSCAddressSpace.__init__(self)
 		StreamRequestHandler.__init__(self, request, client_address, server)
 
-	def _unbundle(self, decoded):
-		"""Recursive bundle-unpacking function"""
+	def _unbundle(self, decoded, replies):
+		"""Recursive bundle-unpacking function, collecting the replies in 'replies'.
+		Bundles with a future timetag are left to the server's scheduler (see OSCScheduler)
+		"""
 		if decoded[0] != "#bundle":
-			self.replies += self.dispatchMessage(decoded[0], decoded[1][1:], decoded[2:], self.client_address)
+			replies += self.dispatchMessage(decoded[0], decoded[1][1:], decoded[2:], self.client_address)
 			return
 		
-		now = time.time()
 		timetag = decoded[1]
-		if (timetag > 0.) and (timetag > now):
-			time.sleep(timetag - now)
+		if (timetag > 0.) and self.server.scheduler.schedule(timetag, self._runBundle, decoded):
+			return
 		
 		for msg in decoded[2:]:
-			self._unbundle(msg)
+			self._unbundle(msg, replies)
+	
+	def _runBundle(self, decoded):
+		"""Handle the contents of a bundle scheduled for later, and send any replies over the connection
+		"""
+		replies = []
+		for msg in decoded[2:]:
+			self._unbundle(msg, replies)
+		
+		self._sendReplies(replies)
+	
+	def _sendReplies(self, replies):
+		"""Send the replies returned by the callback(s) as an OSCMessage or OSCBundle.
+		Returns False if the connection has been closed
+		"""
+		if len(replies) > 1:
+			msg = OSCBundle()
+			for reply in replies:
+				msg.append(reply)
+		elif len(replies) == 1:
+			msg = replies[0]
+		else:
+			return True
+		
+		self._txMutex.acquire()
+		try:
+			return self._transmitMsg(msg)
+		finally:
+			self._txMutex.release()
 			
 	def setup(self):
 		StreamRequestHandler.setup(self)
@@ -2500,15 +5522,16 @@ class OSCStreamRequestHandler(StreamRequestHandler, OSCAddressSpace):
 	def _receive(self, count):
 		""" Receive a certain amount of data from the socket and return it. If the
 		remote end should be closed in the meanwhile None is returned.
+		The data is received straight into a bytearray, which decodeOSC() can handle.
 		"""
-		chunk = self.connection.recv(count)
-		if not chunk or len(chunk) == 0:
-			return None
-		while len(chunk) < count:
-			tmp = self.connection.recv(count - len(chunk))
-			if not tmp or len(tmp) == 0:
+		chunk = bytearray(count)
+		view = memoryview(chunk)
+		received = 0
+		while received < count:
+			n = self.connection.recv_into(view[received:], count - received)
+			if not n:
 				return None
-			chunk = chunk + tmp
+			received += n
 		return chunk
 
 	def _receiveMsg(self):
@@ -2528,7 +5551,7 @@ class OSCStreamRequestHandler(StreamRequestHandler, OSCAddressSpace):
 			print "SERVER: Socket has been closed."
 			return None
 		# decode OSC data and dispatch
-		msg = decodeOSC(chunk)
+		msg = decodeOSC(chunk, self.server.blob_views, self.server.array_runs)
 		if msg == None:
 			raise OSCError("SERVER: Message decoding failed.")		
 		return msg
@@ -2556,21 +5579,9 @@ class OSCStreamRequestHandler(StreamRequestHandler, OSCAddressSpace):
 					continue
 
 				self.replies = []
-				self._unbundle(decoded)
-
-				if len(self.replies) > 1:
-					msg = OSCBundle()
-					for reply in self.replies:
-						msg.append(reply)
-				elif len(self.replies) == 1:
-					msg = self.replies[0]
-				else:
-					# no replies, continue receiving
-					continue
-				self._txMutex.acquire()
-				txOk = self._transmitMsg(msg)
-				self._txMutex.release()
-				if not txOk:
+				self._unbundle(decoded, self.replies)
+
+				if not self._sendReplies(self.replies):
 					break
 		
 		except socket.error, e:
@@ -2622,6 +5633,10 @@ class OSCStreamingServer(TCPServer):
 	# useful customized server. See the testbench for an example
 	RequestHandlerClass = OSCStreamRequestHandler
 	
+	# decoding options for the streams' request-handlers (see OSCAddressSpace)
+	blob_views = OSCAddressSpace.blob_views
+	array_runs = OSCAddressSpace.array_runs
+	
 	def __init__(self, address):
 		"""Instantiate an OSCStreamingServer.
 		  - server_address ((host, port) tuple): the local host & UDP-port
@@ -2632,6 +5647,10 @@ class OSCStreamingServer(TCPServer):
 		TCPServer.__init__(self, address, self.RequestHandlerClass)
 		self.socket.settimeout(self.socket_timeout)
 		
+		# calls the callbacks of bundles with a future timetag, when they are due.
+		# These are shared by all connections.
+		self.scheduler = OSCScheduler()
+		
 	def serve_forever(self):
 		"""Handle one request at a time until server is closed.
 		Had to add this since 2.5 does not support server.shutdown()
@@ -2650,6 +5669,7 @@ class OSCStreamingServer(TCPServer):
 		""" Stop the server thread and close the socket. """
 		self.running = False
 		self._server_thread.join()
+		self.scheduler.close()
 		self.server_close()
 		# 2.6 only
 		#self.shutdown()
@@ -2710,11 +5730,16 @@ class OSCStreamingClient(OSCAddressSpace):
 		self.socket.settimeout(1.0)
 		self._running = False
 		
+		# calls the callbacks of bundles with a future timetag, when they are due
+		self.scheduler = OSCScheduler()
+		
 	def _receiveWithTimeout(self, count):
-		chunk = str()
-		while len(chunk) < count:
+		chunk = bytearray(count)
+		view = memoryview(chunk)
+		received = 0
+		while received < count:
 			try:
-				tmp = self.socket.recv(count - len(chunk))
+				n = self.socket.recv_into(view[received:], count - received)
 			except socket.timeout:
 				if not self._running:
 					print "CLIENT: Socket timed out and termination requested."
@@ -2727,10 +5752,10 @@ class OSCStreamingClient(OSCAddressSpace):
 					return None
 				else:
 					raise e
-			if not tmp or len(tmp) == 0:
+			if not n:
 				print "CLIENT: Socket has been closed."
 				return None
-			chunk = chunk + tmp
+			received += n
 		return chunk
 	def _receiveMsgWithTimeout(self):
 		""" Receive OSC message from a socket and decode.
@@ -2747,7 +5772,7 @@ class OSCStreamingClient(OSCAddressSpace):
 		if not chunk:
 			return None
 		# decode OSC content
-		msg = decodeOSC(chunk)
+		msg = decodeOSC(chunk, self.blob_views, self.array_runs)
 		if msg == None:
 			raise OSCError("CLIENT: Message decoding failed.")
 		return msg
@@ -2763,34 +5788,53 @@ class OSCStreamingClient(OSCAddressSpace):
 				continue
 			
 			self.replies = []
-			self._unbundle(decoded)
-			if len(self.replies) > 1:
-				msg = OSCBundle()
-				for reply in self.replies:
-					msg.append(reply)
-			elif len(self.replies) == 1:
-				msg = self.replies[0]
-			else:
-				continue
-			self._txMutex.acquire()
-			txOk = self._transmitMsgWithTimeout(msg)
-			self._txMutex.release()
-			if not txOk:
+			self._unbundle(decoded, self.replies)
+			if not self._sendReplies(self.replies):
 				break
 		print "CLIENT: Receiving thread terminated."
 		
-	def _unbundle(self, decoded):
+	def _unbundle(self, decoded, replies):
+		"""Recursive bundle-unpacking function, collecting the replies in 'replies'.
+		Bundles with a future timetag are left to the client's scheduler (see OSCScheduler)
+		"""
 		if decoded[0] != "#bundle":
-			self.replies += self.dispatchMessage(decoded[0], decoded[1][1:], decoded[2:], self.socket.getpeername())
+			replies += self.dispatchMessage(decoded[0], decoded[1][1:], decoded[2:], self.socket.getpeername())
 			return
 		
-		now = time.time()
 		timetag = decoded[1]
-		if (timetag > 0.) and (timetag > now):
-			time.sleep(timetag - now)
+		if (timetag > 0.) and self.scheduler.schedule(timetag, self._runBundle, decoded):
+			return
 		
 		for msg in decoded[2:]:
-			self._unbundle(msg)
+			self._unbundle(msg, replies)
+
+	def _runBundle(self, decoded):
+		"""Handle the contents of a bundle scheduled for later, and send any replies to the server
+		"""
+		replies = []
+		for msg in decoded[2:]:
+			self._unbundle(msg, replies)
+		
+		self._sendReplies(replies)
+
+	def _sendReplies(self, replies):
+		"""Send the replies returned by the callback(s) as an OSCMessage or OSCBundle.
+		Returns False if the connection has been closed
+		"""
+		if len(replies) > 1:
+			msg = OSCBundle()
+			for reply in replies:
+				msg.append(reply)
+		elif len(replies) == 1:
+			msg = replies[0]
+		else:
+			return True
+		
+		self._txMutex.acquire()
+		try:
+			return self._transmitMsgWithTimeout(msg)
+		finally:
+			self._txMutex.release()
 
 	def connect(self, address):
 		self.socket.connect(address)
@@ -2800,6 +5844,7 @@ class OSCStreamingClient(OSCAddressSpace):
 	def close(self):
 		# let socket time out
 		self._running = False
+		self.scheduler.close()
 		self.receiving_thread.join()
 		self.socket.close()
 
@@ -2878,4 +5923,430 @@ class OSCStreamingClient(OSCAddressSpace):
 		"""
 		return not self.__eq__(other)
 
+######
+#
+# Asynchronous OSC classes (for asyncore event-loops)
+#
+######
+
+# the scheduler shared by all asynchronous OSC endpoints, holding the bundles they receive with a future timetag.
+# asyncLoop() calls their callbacks when they are due.
+global asyncScheduler
+asyncScheduler = OSCScheduler(polled=True)
+
+def asyncLoop(timeout=30.0, use_poll=False, map=None, count=None):
+	"""Run an asyncore event-loop serving the asynchronous OSC endpoints (and any other asyncore-dispatchers)
+	in 'map', like asyncore.loop(). In between, it calls the callbacks of future-dated bundles these received
+	(see asyncScheduler); no poll waits longer than until the next one is due.
+	  - timeout (float): the max. number of seconds each poll waits for the sockets
+	  - use_poll (bool): use poll() instead of select() (needed for more than FD_SETSIZE sockets)
+	  - map (dict): the asyncore socket-map to serve. Default is asyncore.socket_map
+	  - count (int): the number of polls to run, or None to run until all sockets are closed
+	"""
+	if map == None:
+		map = asyncore.socket_map
+	
+	while len(map) and ((count == None) or (count > 0)):
+		delay = asyncScheduler.runDue()
+		if (delay == None) or (delay > timeout):
+			delay = timeout
+		
+		asyncore.loop(delay, use_poll, map, 1)
+		if count != None:
+			count -= 1
+
+def _packReplies(replies):
+	"""Returns the replies returned by the callback(s) as one OSCMessage or OSCBundle, or None if there are none
+	"""
+	if len(replies) > 1:
+		msg = OSCBundle()
+		for reply in replies:
+			msg.append(reply)
+		
+		return msg
+	
+	if len(replies) == 1:
+		return replies[0]
+	
+	return None
+
+class OSCAsyncServer(asyncore.dispatcher, OSCAddressSpace):
+	"""An OSC-server (UDP) for an asyncore event-loop (see asyncLoop()).
+	Any number of these (and of the other asynchronous OSC endpoints) can be served by one event-loop,
+	in one thread, instead of a thread (and a 1-second socket-timeout) per server.
+	
+	Message-handlers are registered and called as with an OSCServer, from the event-loop; they shouldn't block it.
+	A callback that can't reply right away can send its reply later, with sendto(msg, client_address).
+	Replies that can't be sent right away are queued until the socket is writable.
+	The messages received in one poll are collected for batch-callbacks (see addBatchMsgHandler()).
+	"""
+	# the max. number of datagrams read (and handled) per poll
+	max_burst = 64
+	
+	max_packet_size = 8192
+	
+	def __init__(self, server_address=None, map=None):
+		"""Instantiate an OSCAsyncServer.
+		  - server_address ((host, port) tuple): the local host & UDP-port the server listens on.
+		  None binds an ephemeral port.
+		  - map (dict): the asyncore socket-map the server is served in. Default is asyncore.socket_map
+		"""
+		asyncore.dispatcher.__init__(self, map=map)
+		OSCAddressSpace.__init__(self)
+		
+		if server_address == None:
+			server_address = ('', 0)
+		
+		self.create_socket(socket.AF_INET, socket.SOCK_DGRAM)
+		self.bind(server_address)
+		
+		# counters of the OSC-packets & -messages received (see OSCServer.stats)
+		self.stats = {'packets':0, 'messages':0}
+		
+		self.scheduler = asyncScheduler
+		self._outgoing = collections.deque()
+	
+	def address(self):
+		"""Returns a (host,port) tuple of the local address this server is bound to
+		"""
+		return self.socket.getsockname()
+	
+	def writable(self):
+		"""Only wait for the socket to become writable if there are replies waiting to be sent
+		"""
+		return len(self._outgoing) > 0
+	
+	def handle_read(self):
+		"""Read the datagrams waiting on the socket, up to 'max_burst' of them, and handle each one
+		"""
+		batches = {}
+		try:
+			for i in range(self.max_burst):
+				try:
+					(packet, client_address) = self.socket.recvfrom(self.max_packet_size)
+				except socket.error, e:
+					if e[0] == errno.ECONNREFUSED:
+						# an earlier datagram sent from this socket was refused
+						continue
+					if e[0] in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+						break
+					raise
+				
+				try:
+					self.handlePacket(packet, client_address, batches)
+				except:
+					self.handle_error()
+		finally:
+			self._flushBatches(batches)
+	
+	def handlePacket(self, packet, client_address, batches=None):
+		"""Decode & dispatch one OSC-packet received from 'client_address', and send any replies back
+		"""
+		decoded = decodeOSC(packet, self.blob_views, self.array_runs)
+		if not len(decoded):
+			return
+		
+		self.stats['packets'] += 1
+		replies = []
+		self._unbundle(decoded, client_address, replies, batches)
+		
+		msg = _packReplies(replies)
+		if msg != None:
+			self.sendto(msg, client_address)
+	
+	def _unbundle(self, decoded, client_address, replies, batches=None):
+		"""Recursive bundle-unpacking function, collecting the replies in 'replies'.
+		Bundles with a future timetag are left to the scheduler (see asyncLoop())
+		"""
+		if decoded[0] != "#bundle":
+			self.stats['messages'] += 1
+			replies += self.dispatchMessage(decoded[0], decoded[1][1:], decoded[2:], client_address, batches)
+			return
+		
+		timetag = decoded[1]
+		if (timetag > 0.) and self.scheduler.schedule(timetag, self._runBundle, decoded, client_address):
+			return
+		
+		for msg in decoded[2:]:
+			self._unbundle(msg, client_address, replies, batches)
+	
+	def _runBundle(self, decoded, client_address):
+		"""Handle the contents of a bundle scheduled for later, and send any replies
+		"""
+		replies = []
+		for msg in decoded[2:]:
+			self._unbundle(msg, client_address, replies)
+		
+		msg = _packReplies(replies)
+		if msg != None:
+			self.sendto(msg, client_address)
+	
+	def sendto(self, msg, address):
+		"""Send an OSCMessage (or OSCBundle) to 'address' ((host, port) tuple),
+		or queue it until the socket is writable
+		"""
+		binary = _getBinary(msg)
+		if not len(self._outgoing):
+			try:
+				self.socket.sendto(binary, address)
+				return
+			except socket.error, e:
+				if e[0] not in (errno.EAGAIN, errno.EWOULDBLOCK):
+					raise
+		
+		self._outgoing.append((binary, address))
+	
+	def handle_write(self):
+		"""Send the queued replies, as far as the socket takes them
+		"""
+		while len(self._outgoing):
+			(binary, address) = self._outgoing[0]
+			try:
+				self.socket.sendto(binary, address)
+			except socket.error, e:
+				if e[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
+					return
+				raise
+			
+			self._outgoing.popleft()
+	
+	def handle_error(self):
+		"""Handle an exception in the callbacks gracefully.
+		Writes the error to sys.stderr, but (unlike asyncore) doesn't close the socket
+		"""
+		(e_type, e) = sys.exc_info()[:2]
+		sys.stderr.write("%s: %s: %s\n" % (self.__class__.__name__, e_type.__name__, str(e)))
+	
+	def __str__(self):
+		"""Returns a string containing this Server's Class-name, software-version and local bound address
+		"""
+		out = self.__class__.__name__
+		out += " v%s.%s-%s" % version
+		out += " listening on osc://%s" % getUrlStr(self.address())
+		return out
+
+class OSCAsyncClient(OSCAsyncServer):
+	"""An OSC-client (UDP) for an asyncore event-loop (see asyncLoop()).
+	Sends from an ephemeral port, and dispatches whatever it receives there (like replies)
+	to its own message-handlers.
+	"""
+	def __init__(self, address=None, map=None):
+		"""Instantiate an OSCAsyncClient.
+		  - address ((host, port) tuple): the remote OSC-server that send() sends to (see connect())
+		  - map (dict): the asyncore socket-map the client is served in. Default is asyncore.socket_map
+		"""
+		OSCAsyncServer.__init__(self, None, map)
+		self.client_address = address
+	
+	def connect(self, address):
+		"""Set the remote OSC-server that send() sends to.
+		The socket isn't connected, so replies from anywhere are still received.
+		"""
+		self.client_address = address
+	
+	def send(self, msg):
+		"""Send an OSCMessage (or OSCBundle) to the remote OSC-server set with connect()
+		"""
+		if self.client_address == None:
+			raise OSCClientError("Called send() on non-connected client")
+		
+		self.sendto(msg, self.client_address)
+	
+	def __str__(self):
+		"""Returns a string containing this Client's Class-name, software-version
+		and the remote-address it sends to (if any)
+		"""
+		out = self.__class__.__name__
+		out += " v%s.%s-%s" % version
+		if self.client_address:
+			out += " connected to osc://%s" % getUrlStr(self.client_address)
+		else:
+			out += " (unconnected)"
+		
+		return out
+
+class _OSCAsyncStream(asynchat.async_chat):
+	"""An OSC-stream (TCP) connection for an asyncore event-loop.
+	Reads OSC-packets prefixed by their size as an int32 (like OSCStreamingServer), dispatches them
+	to the message-handlers of 'self.space' (an OSCAddressSpace) and sends replies back the same way.
+	"""
+	def __init__(self, sock=None, map=None):
+		asynchat.async_chat.__init__(self, sock, map)
+		self._incoming = []
+		self._packetSize = None
+		self.set_terminator(4)
+		
+		self.scheduler = asyncScheduler
+	
+	def collect_incoming_data(self, data):
+		self._incoming.append(data)
+	
+	def found_terminator(self):
+		"""Called with a complete size-prefix or packet in the incoming data
+		"""
+		data = "".join(self._incoming)
+		self._incoming = []
+		
+		if self._packetSize == None:
+			self._packetSize = struct.unpack(">L", data)[0]
+			if self._packetSize == 0:
+				self._packetSize = None
+			else:
+				self.set_terminator(self._packetSize)
+			
+			return
+		
+		self._packetSize = None
+		self.set_terminator(4)
+		try:
+			self.handlePacket(data)
+		except:
+			self.handle_error()
+	
+	def handlePacket(self, packet):
+		"""Decode & dispatch one OSC-packet, and send any replies back
+		"""
+		decoded = decodeOSC(packet, self.space.blob_views, self.space.array_runs)
+		if not len(decoded):
+			return
+		
+		replies = []
+		self._unbundle(decoded, replies)
+		
+		msg = _packReplies(replies)
+		if msg != None:
+			self.sendOSC(msg)
+	
+	def _unbundle(self, decoded, replies):
+		"""Recursive bundle-unpacking function, collecting the replies in 'replies'.
+		Bundles with a future timetag are left to the scheduler (see asyncLoop())
+		"""
+		if decoded[0] != "#bundle":
+			replies += self.space.dispatchMessage(decoded[0], decoded[1][1:], decoded[2:], self.addr)
+			return
+		
+		timetag = decoded[1]
+		if (timetag > 0.) and self.scheduler.schedule(timetag, self._runBundle, decoded):
+			return
+		
+		for msg in decoded[2:]:
+			self._unbundle(msg, replies)
+	
+	def _runBundle(self, decoded):
+		"""Handle the contents of a bundle scheduled for later, and send any replies
+		"""
+		replies = []
+		for msg in decoded[2:]:
+			self._unbundle(msg, replies)
+		
+		msg = _packReplies(replies)
+		if msg != None:
+			self.sendOSC(msg)
+	
+	def sendOSC(self, msg):
+		"""Send an OSCMessage (or OSCBundle) over the connection, prefixed by its size.
+		It's queued until the socket is writable (or connected)
+		"""
+		binary = _getBinary(msg)
+		self.push(struct.pack(">L", len(binary)) + binary)
+	
+	def handle_error(self):
+		"""Handle an exception in the callbacks gracefully.
+		Writes the error to sys.stderr, but (unlike asyncore) doesn't close the connection
+		"""
+		(e_type, e) = sys.exc_info()[:2]
+		sys.stderr.write("%s: %s: %s\n" % (self.__class__.__name__, e_type.__name__, str(e)))
+
+class OSCAsyncStreamHandler(_OSCAsyncStream):
+	"""A connection accepted by an OSCAsyncStreamServer.
+	Its messages are dispatched to the server's message-handlers.
+	"""
+	def __init__(self, server, sock, map=None):
+		_OSCAsyncStream.__init__(self, sock, map)
+		self.server = server
+		self.space = server
+	
+	def handle_close(self):
+		self.server._clientUnregister(self)
+		self.close()
+
+class OSCAsyncStreamServer(asyncore.dispatcher, OSCAddressSpace):
+	"""A connection oriented (TCP/IP) OSC-server for an asyncore event-loop (see asyncLoop()),
+	using the same int32 size-prefixes as OSCStreamingServer.
+	All connections are served in the event-loop's thread, so (unlike with OSCStreamingServer)
+	they share the server's message-handlers; register these with the server itself.
+	"""
+	# the class that handles each new connection
+	HandlerClass = OSCAsyncStreamHandler
+	
+	def __init__(self, server_address, map=None):
+		"""Instantiate an OSCAsyncStreamServer.
+		  - server_address ((host, port) tuple): the local host & TCP-port the server listens on
+		  - map (dict): the asyncore socket-map the server (and its connections) are served in.
+		  Default is asyncore.socket_map
+		"""
+		asyncore.dispatcher.__init__(self, map=map)
+		OSCAddressSpace.__init__(self)
+		
+		self._clientList = []
+		
+		self.create_socket(socket.AF_INET, socket.SOCK_STREAM)
+		self.set_reuse_addr()
+		self.bind(server_address)
+		self.listen(5)
+	
+	def address(self):
+		"""Returns a (host,port) tuple of the local address this server is bound to
+		"""
+		return self.socket.getsockname()
+	
+	def handle_accept(self):
+		pair = self.accept()
+		if pair == None:
+			return
+		
+		self._clientList.append(self.HandlerClass(self, pair[0], self._map))
+	
+	def _clientUnregister(self, client):
+		"""Called by a connection-handler when its connection is closed
+		"""
+		if client in self._clientList:
+			self._clientList.remove(client)
+	
+	def broadcastToClients(self, oscData):
+		"""Send an OSC message or bundle to all connected clients
+		"""
+		for client in self._clientList:
+			client.sendOSC(oscData)
+	
+	def close(self):
+		"""Close all connections, and the listening socket
+		"""
+		for client in list(self._clientList):
+			client.close()
+		
+		self._clientList = []
+		asyncore.dispatcher.close(self)
+
+class OSCAsyncStreamClient(_OSCAsyncStream, OSCAddressSpace):
+	"""An OSC-stream (TCP) client for an asyncore event-loop (see asyncLoop()).
+	Messages sent before the connection is established are queued; whatever the server sends
+	(like replies) is dispatched to the client's own message-handlers.
+	"""
+	def __init__(self, address=None, map=None):
+		"""Instantiate an OSCAsyncStreamClient.
+		  - address ((host, port) tuple): the OSC-stream server to connect to (see connect())
+		  - map (dict): the asyncore socket-map the client is served in. Default is asyncore.socket_map
+		"""
+		_OSCAsyncStream.__init__(self, None, map)
+		OSCAddressSpace.__init__(self)
+		self.space = self
+		
+		self.create_socket(socket.AF_INET, socket.SOCK_STREAM)
+		if address != None:
+			self.connect(address)
+	
+	def handle_connect(self):
+		pass
+
 # vim:noexpandtab
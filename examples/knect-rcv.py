@@ -31,10 +31,8 @@ def quit_callback(path, tags, args, source):
     global run
     run = False
 
-server.addMsgHandler( "/user/1", user_callback )
-server.addMsgHandler( "/user/2", user_callback )
-server.addMsgHandler( "/user/3", user_callback )
-server.addMsgHandler( "/user/4", user_callback )
+# one handler for /user/1 through /user/4
+server.addMsgHandler( "/user/[1-4]", user_callback )
 server.addMsgHandler( "/quit", quit_callback )
 
 # user script that's called by the game engine every frame
@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
-from OSC import OSCClient, OSCMessage
+from OSC import OSCClient, OSCMessage, OSCMessageTemplate
 
 client = OSCClient()
 client.connect( ("localhost", 7110) )
 
-client.send( OSCMessage("/user/1", [1.0, 2.0, 3.0 ] ) )
-client.send( OSCMessage("/user/2", [2.0, 3.0, 4.0 ] ) )
-client.send( OSCMessage("/user/3", [2.0, 3.0, 3.1 ] ) )
-client.send( OSCMessage("/user/4", [3.2, 3.4, 6.0 ] ) )
+# all /user/N messages carry three floats; pack them through precompiled templates
+users = dict((n, OSCMessageTemplate("/user/%d" % n, ",fff")) for n in range(1, 5))
 
-client.send( OSCMessage("/quit") )
+client.send( users[1].pack(1.0, 2.0, 3.0) )
+client.send( users[2].pack(2.0, 3.0, 4.0) )
+client.send( users[3].pack(2.0, 3.0, 3.1) )
+client.send( users[4].pack(3.2, 3.4, 6.0) )
 
+client.send( OSCMessage("/quit") )
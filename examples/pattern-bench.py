@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# Compares the OSC address-pattern matcher (OSCPattern) against the
+# regular-expression route (getRegEx) it replaced.
+# usage: python pattern-bench.py [number-of-rounds]
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from OSC import OSCPattern, OSCServer, getPattern, getRegEx
+
+rounds = 2000
+if len(sys.argv) > 1:
+    rounds = int(sys.argv[1])
+
+# an address-space like a 64-channel mixer's
+addresses = []
+for ch in range(1, 65):
+    for param in ('fader', 'mute', 'solo', 'pan', 'eq/hi', 'eq/mid', 'eq/lo'):
+        addresses.append("/mixer/ch%d/%s" % (ch, param))
+
+patterns = [
+    "/mixer/ch1/fader",
+    "/mixer/*/mute",
+    "/mixer/ch?/solo",
+    "/mixer/ch[1-4]/pan",
+    "/mixer/ch[!1]/fader",
+    "/mixer/ch{1,2,3}/eq/*",
+    "/mixer/ch*1/{mute,solo}",
+]
+
+def regex_compile(pattern):
+    re.purge()
+    return getRegEx(pattern)
+
+def regex_match(pattern):
+    expr = getRegEx(pattern)
+    found = []
+    for addr in addresses:
+        match = expr.match(addr)
+        if match and (match.end() == len(addr)):
+            found.append(addr)
+    return found
+
+def pattern_match(pattern):
+    compiled = OSCPattern(pattern)
+    return [addr for addr in addresses if compiled.match(addr)]
+
+def report(label, func, number):
+    best = min(timeit.repeat(func, repeat=3, number=number))
+    print("  %-28s %10.2f us" % (label, best / number * 1e6))
+
+print("%d addresses, %d rounds per pattern" % (len(addresses), rounds))
+
+for pattern in patterns:
+    print("")
+    print(pattern)
+    if regex_match(pattern) != pattern_match(pattern):
+        print("  (getRegEx matches a different set of addresses here)")
+
+    expr = getRegEx(pattern)
+    compiled = OSCPattern(pattern)
+    key = addresses[-1]
+
+    report("getRegEx compile", lambda: regex_compile(pattern), rounds)
+    report("OSCPattern compile", lambda: OSCPattern(pattern), rounds)
+    report("getRegEx from re's cache", lambda: getRegEx(pattern), rounds)
+    report("getPattern from cache", lambda: getPattern(pattern), rounds)
+    report("getRegEx match one", lambda: expr.match(key), rounds * 10)
+    report("OSCPattern match one", lambda: compiled.match(key), rounds * 10)
+    report("getRegEx scan all", lambda: regex_match(pattern), rounds // 20 or 1)
+    report("OSCPattern scan all", lambda: pattern_match(pattern), rounds // 20 or 1)
+
+# the dispatch route: what the OSCServer does with an incoming pattern,
+# compared to scanning the whole address-space with getRegEx()
+server = OSCServer(('localhost', 0))
+for addr in addresses:
+    server.addMsgHandler(addr, lambda *args: None)
+
+def lookup():
+    server.matchCache.clear()
+    return server._matchAddresses(pattern)
+
+print("")
+print("dispatch lookup, match-cache disabled")
+for pattern in patterns:
+    print(pattern)
+    report("getRegEx scan all", lambda: regex_match(pattern), rounds // 20 or 1)
+    report("OSCServer address-tree", lookup, rounds)
+
+server.close()
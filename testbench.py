@@ -117,7 +117,7 @@ def testStreamingServerAndClient(listen_address):
 	
 	waitbundle = OSCBundle("/print")
 	waitbundle.setTimeTag(time.time() + 5)
-	waitbundle.append("Note how the (single-thread) server blocks while holding this bundle")
+	waitbundle.append("Note how the server keeps receiving while holding this bundle")
 	
 	print "Set timetag 5 s into the future"
 	print "sending: ", waitbundle
@@ -180,6 +180,235 @@ def testStreamingServerAndClient(listen_address):
 	
 	print "Done. Arrivederci!"
 	sys.exit()
+
+def testPreforkedServer(listen_address, workers):
+	""" Testbench for the PreforkedOSCServer.
+	Starts 'workers' worker-processes sharing one UDP-port, sends them messages from a number of
+	clients (the kernel spreads the datagrams over the workers by their source-address), then kills
+	one of the workers to see the supervisor restart it, without losing the stats it published.
+	"""
+	print "\nInstantiating PreforkedOSCServer:"
+	
+	# the workers are forked processes; each prints what it got, with its pid
+	def printing_handler(addr, tags, stuff, source):
+		sys.stdout.write("WORKER %d: Got '%s [%s] %s' from %s\n" % (os.getpid(), addr, tags, str(stuff), getUrlStr(source)))
+		sys.stdout.flush()
+	
+	s = PreforkedOSCServer(listen_address, workers)
+	s.addMsgHandler("/print", printing_handler)
+	print s
+	
+	print "Starting the workers. Use ctrl-C to quit."
+	st = threading.Thread(target=s.serve_forever)
+	st.start()
+	
+	try:
+		time.sleep(0.5)
+		print "Worker pids:", [pid for (pid, stats) in s.getWorkerStats()]
+		
+		print "\nSending Messages from %d clients" % (workers * 4)
+		clients = []
+		for i in range(workers * 4):
+			c = OSCClient()
+			c.connect(listen_address)
+			clients.append(c)
+		
+		for count in range(5):
+			for i in range(len(clients)):
+				msg = OSCMessage("/print")
+				msg.append(["client %d" % i, count])
+				clients[i].send(msg)
+			
+			time.sleep(0.1)
+		
+		time.sleep(0.5)
+		print "\nStats per worker:"
+		for (pid, stats) in s.getWorkerStats():
+			print pid, stats
+		
+		total = s.getStats()
+		print "Total:", total
+		print "Received %d of the %d messages sent" % (total['messages'], len(clients) * 5)
+		
+		(pid, stats) = s.getWorkerStats()[0]
+		print "\nKilling worker %d; the supervisor should restart it" % pid
+		os.kill(pid, signal.SIGKILL)
+		time.sleep(s.check_interval * 3)
+		
+		print "Worker pids:", [pid for (pid, stats) in s.getWorkerStats()]
+		total = s.getStats()
+		print "Total:", total
+		print "Restarts: %d (the killed worker's stats are kept)" % total['restarts']
+		
+		for c in clients:
+			c.close()
+		
+	except KeyboardInterrupt:
+		print "Interrupted."
+	
+	print "\nClosing PreforkedOSCServer"
+	s.running = False
+	st.join()
+	s.close()
+	
+	print "Done."
+	sys.exit()
+
+def testAsyncServerAndClient(listen_address):
+	""" Testbench for the asynchronous (asyncore) OSC endpoints.
+	An OSCAsyncServer (UDP) & an OSCAsyncStreamServer (TCP, on the next port up) are served
+	in one event-loop, in this thread, together with a client for each.
+	The clients send messages and a future-dated bundle, and print the servers' replies.
+	"""
+	stream_address = (listen_address[0], listen_address[1] + 1)
+	
+	# our own socket-map, so asyncLoop() only serves the endpoints of this test
+	socket_map = {}
+	
+	def serve(seconds):
+		# run the event-loop for a while
+		end = time.time() + seconds
+		while time.time() < end:
+			asyncLoop(0.05, map=socket_map, count=1)
+	
+	def printing_handler(addr, tags, stuff, source):
+		msg_string = "%s [%s] %s" % (addr, tags, str(stuff))
+		print "SERVER: Got '%s' from %s" % (msg_string, getUrlStr(source))
+		
+		# send a reply to the client.
+		msg = OSCMessage("/printed")
+		msg.append(msg_string)
+		return msg
+	
+	def printed_handler(addr, tags, stuff, source):
+		print "CLIENT: Reply from %s: %s" % (getUrlStr(source), stuff[0])
+	
+	def broadcast_handler(addr, tags, stuff, source):
+		print "CLIENT: Broadcast: %s" % str(stuff)
+	
+	print "\nInstantiating OSCAsyncServer & OSCAsyncStreamServer:"
+	s = OSCAsyncServer(listen_address, socket_map)
+	s.addMsgHandler("/print", printing_handler)
+	print s
+	
+	ts = OSCAsyncStreamServer(stream_address, socket_map)
+	ts.addMsgHandler("/print", printing_handler)
+	print ts
+	
+	print "\nInstantiating OSCAsyncClient & OSCAsyncStreamClient:"
+	c = OSCAsyncClient(listen_address, socket_map)
+	c.addMsgHandler("/printed", printed_handler)
+	print c
+	
+	tc = OSCAsyncStreamClient(stream_address, socket_map)
+	tc.addMsgHandler("/printed", printed_handler)
+	tc.addMsgHandler("/broadcast", broadcast_handler)
+	print tc
+	
+	try:
+		print "\nSending Messages"
+		for count in range(3):
+			msg = OSCMessage("/print")
+			msg.append(["over UDP", count])
+			c.send(msg)
+			
+			msg = OSCMessage("/print")
+			msg.append(["over TCP", count])
+			tc.sendOSC(msg)
+			
+			serve(0.1)
+		
+		print "\nBroadcasting to the connected stream-clients"
+		ts.broadcastToClients(OSCMessage("/broadcast", ["hello", len(ts._clientList)]))
+		serve(0.1)
+		
+		print "\nBundles can be given a timestamp; the event-loop holds them until their time has come"
+		b = OSCBundle("/print")
+		b.setTimeTag(time.time() + 1)
+		b.append("held for 1 sec (over UDP)")
+		c.send(b)
+		
+		b = OSCBundle("/print")
+		b.setTimeTag(time.time() + 1)
+		b.append("held for 1 sec (over TCP)")
+		tc.sendOSC(b)
+		
+		serve(0.5)
+		print "Bundles waiting after 0.5 sec: %d" % asyncScheduler.pending()
+		serve(1.0)
+		print "Bundles waiting after 1.5 sec: %d" % asyncScheduler.pending()
+		
+		print "\nServer stats:", s.stats
+		
+	except KeyboardInterrupt:
+		print "Interrupted."
+	
+	print "\nClosing clients & servers"
+	c.close()
+	tc.close()
+	ts.close()
+	s.close()
+	serve(0.1)
+	
+	print "Sockets left in the event-loop: %d" % len(socket_map)
+	print "Done."
+	sys.exit()
+
+def testLatePolicies(listen_address, server_class):
+	""" Testbench for the handling of late bundles by the server's OSCScheduler.
+	For each of the scheduler's late-policies, sends the server a bundle that's due in the future,
+	one that's a little late (but within the scheduler's tolerance), and one that's a second late,
+	then prints which of them were handled, and the scheduler's stats.
+	"""
+	print "\nInstantiating %s:" % server_class.__name__
+	
+	handled = []
+	def printing_handler(addr, tags, stuff, source):
+		sys.stdout.write("SERVER: Got '%s'\n" % stuff[0])
+		handled.append(stuff[0])
+	
+	s = server_class(listen_address)
+	s.addMsgHandler("/print", printing_handler)
+	s.scheduler.tolerance = 0.1
+	print s
+	
+	st = threading.Thread(target=s.serve_forever)
+	st.start()
+	
+	c = OSCClient()
+	c.connect(listen_address)
+	
+	expected = {'run':"handled, not counted", 'drop':"dropped, and counted", 'count':"handled, and counted"}
+	try:
+		for policy in s.scheduler.late_policies:
+			print "\nLate-policy '%s': the late bundle should be %s" % (policy, expected[policy])
+			s.scheduler.setLatePolicy(policy)
+			s.scheduler.resetStats()
+			del handled[:]
+			
+			for (delay, what) in ((0.5, "due in 0.5 sec"), (-0.05, "within tolerance"), (-1., "1 sec late")):
+				b = OSCBundle("/print")
+				b.setTimeTag(time.time() + delay)
+				b.append(what)
+				c.send(b)
+			
+			time.sleep(1)
+			print "Handled:", handled
+			print "Scheduler stats:", s.scheduler.stats
+		
+		if hasattr(s, 'pool'):
+			print "\nWorker-pool stats:", s.pool.stats
+		
+	except KeyboardInterrupt:
+		print "Interrupted."
+	
+	print "\nClosing %s" % server_class.__name__
+	s.close()
+	st.join()
+	c.close()
+	
+	print "Done."
+	sys.exit()
 			
 
 ###############################################################################
@@ -200,6 +429,14 @@ if __name__ == "__main__":
 			help="Test ThreadingOSCServer")
 	op.add_option("-f", "--forking", action="store_true", dest="forking",
 			help="Test ForkingOSCServer")
+	op.add_option("-p", "--pooled", action="store_true", dest="pooled",
+			help="Test PooledOSCServer")
+	op.add_option("-w", "--workers", type="int", dest="workers",
+			help="Test PreforkedOSCServer with the given number of worker-processes")
+	op.add_option("-a", "--async", action="store_true", dest="async",
+			help="Test the asynchronous (asyncore) OSC servers & clients")
+	op.add_option("-L", "--late", action="store_true", dest="late",
+			help="Test the handling of late bundles (by an OSCServer, or the server selected with -t or -p)")
 	op.add_option("-u", "--usage", action="help", help="show this help message and exit")
 	
 	op.add_option("-c", "--streaming", action="store_true", dest="streaming",
@@ -209,6 +446,10 @@ if __name__ == "__main__":
 	op.set_defaults(sendto="")
 	op.set_defaults(threading=False)
 	op.set_defaults(forking=False)
+	op.set_defaults(pooled=False)
+	op.set_defaults(workers=0)
+	op.set_defaults(async=False)
+	op.set_defaults(late=False)
 	op.set_defaults(streaming=False)
 
 	# Parse args
@@ -244,6 +485,23 @@ if __name__ == "__main__":
 		testStreamingServerAndClient(listen_address)
 		sys.exit(0)
 	
+	if opts.workers:
+		testPreforkedServer(listen_address, opts.workers)
+		sys.exit(0)
+	
+	if opts.async:
+		testAsyncServerAndClient(listen_address)
+		sys.exit(0)
+	
+	if opts.late:
+		if opts.threading:
+			testLatePolicies(listen_address, ThreadingOSCServer)
+		elif opts.pooled:
+			testLatePolicies(listen_address, PooledOSCServer)
+		else:
+			testLatePolicies(listen_address, OSCServer)
+		sys.exit(0)
+	
 	welcome = "Welcome to the OSC testing program."
 	print welcome
 	hexDump(welcome)
@@ -305,6 +563,19 @@ if __name__ == "__main__":
 	print blob
 	hexDump(blob.getBinary())
 
+	print "\nTesting array-runs: a run of 32 floats, decoded with array_runs=16, reaches the handler as one array"
+	
+	floats = OSCMessage("/floats")
+	floats.append([i * 0.5 for i in range(32)])
+	
+	def array_handler(addr, tags, stuff, source):
+		print "Handler got %d argument(s) for %d typetags; the first is a %s of length %d" % (len(stuff), len(tags), type(stuff[0]).__name__, len(stuff[0]))
+	
+	space = OSCAddressSpace()
+	space.addMsgHandler("/floats", array_handler)
+	decoded = decodeOSC(floats.getBinary(), array_runs=16)
+	space.dispatchMessage(decoded[0], decoded[1][1:], decoded[2:], None)
+
 	print1 = OSCMessage()
 	print1.setAddress("/print")
 	print1.append("Hey man, that's cool.")
@@ -358,6 +629,8 @@ if __name__ == "__main__":
 		s = ThreadingOSCServer(listen_address, c, return_port=listen_address[1])
 	elif opts.forking:
 		s = ForkingOSCServer(listen_address, c, return_port=listen_address[1])
+	elif opts.pooled:
+		s = PooledOSCServer(listen_address, c, return_port=listen_address[1])
 	else:
 		s = OSCServer(listen_address, c, return_port=listen_address[1])
 	
@@ -432,10 +705,7 @@ if __name__ == "__main__":
 	
 	waitbundle = OSCBundle("/print")
 	waitbundle.setTimeTag(time.time() + 5)
-	if s.__class__ == OSCServer:
-		waitbundle.append("Note how the (single-thread) OSCServer blocks while holding this bundle")
-	else:
-		waitbundle.append("Note how the %s does not block while holding this bundle" % s.__class__.__name__)
+	waitbundle.append("Note how the %s keeps receiving while holding this bundle" % s.__class__.__name__)
 	
 	print "Set timetag 5 s into the future"
 	print "sending: ", waitbundle
@@ -462,10 +732,10 @@ if __name__ == "__main__":
 	b.append("held for 15 sec")
 	bb.append(b)
 	
+	bb.append("Note how the %s's scheduler handles the sub-bundles in the order dictated by their timestamps" % s.__class__.__name__)
 	if s.__class__ == OSCServer:
-		bb.append("Note how the (single-thread) OSCServer handles the bundle's contents in order of appearance")
+		bb.append("Each bundle's contents are processed in order of appearance, by the (single-thread) OSCServer's own loop")
 	else:
-		bb.append("Note how the %s handles the sub-bundles in the order dictated by their timestamps" % s.__class__.__name__)
 		bb.append("Each bundle's contents, however, are processed in random order (dictated by the kernel's threading)")
 	
 	print "sending: ", bb